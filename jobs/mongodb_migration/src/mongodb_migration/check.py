@@ -7,7 +7,6 @@ from collections.abc import Callable, Iterator
 from typing import Optional, TypeVar
 
 from mongoengine import Document
-from pymongo.collection import Collection
 
 # --- some typing subtleties, see https://github.com/sbdchd/mongo-types
 U = TypeVar("U", bound=Document)
@@ -16,15 +15,13 @@ CustomValidation = Callable[[U], None]
 # --- end
 
 
-def get_random_oids(collection: Collection, sample_size: int) -> list[int]:
-    pipeline = [{"$project": {"_id": 1}}, {"$sample": {"size": sample_size}}]
-    return [s["_id"] for s in collection.aggregate(pipeline)]
-
-
 def get_random_documents(DocCls: DocumentClass[Document], sample_size: int) -> Iterator[Document]:
     doc_collection = DocCls._get_collection()
-    random_oids = get_random_oids(doc_collection, sample_size)
-    return DocCls.objects(pk__in=random_oids)  # type: ignore
+    # $sample must be the first stage of the pipeline to use a pseudo-random cursor instead of scanning (and sorting)
+    # the whole collection. The full documents are returned, so that no second query is needed to load them.
+    pipeline = [{"$sample": {"size": sample_size}}]
+    for son in doc_collection.aggregate(pipeline, allowDiskUse=False):
+        yield DocCls._from_son(son)
 
 
 def check_documents(
@@ -2,7 +2,6 @@
 # Copyright 2022 The HuggingFace Authors.
 from typing import Optional
 
-import pytest
 from libcommon.constants import CACHE_COLLECTION_RESPONSES, CACHE_MONGOENGINE_ALIAS
 from libcommon.resources import MongoResource
 from mongoengine.connection import get_db
@@ -28,26 +27,34 @@ def test_cache_add_job_runner_version_without_worker_version(mongo_host: str) ->
         db[CACHE_COLLECTION_RESPONSES].drop()
 
 
-@pytest.mark.parametrize(
-    "worker_version,expected",
-    [
-        ("2.0.0", 2),
-        ("1.5.0", 1),
-        ("WrongFormat", None),
-        (None, None),
-    ],
-)
-def test_cache_add_job_runner_version(mongo_host: str, worker_version: str, expected: Optional[int]) -> None:
+def test_cache_add_job_runner_version(mongo_host: str) -> None:
+    worker_versions: dict[str, Optional[str]] = {
+        "dataset_2": "2.0.0",
+        "dataset_1": "1.5.0",
+        "dataset_wrong_format": "WrongFormat",
+        "dataset_none": None,
+    }
+    expected: dict[str, Optional[int]] = {
+        "dataset_2": 2,
+        "dataset_1": 1,
+        "dataset_wrong_format": None,
+        "dataset_none": None,
+    }
     with MongoResource(database="test_cache_add_job_runner_version", host=mongo_host, mongoengine_alias="cache"):
         db = get_db(CACHE_MONGOENGINE_ALIAS)
         db[CACHE_COLLECTION_RESPONSES].insert_many(
-            [{"kind": "/splits", "dataset": "dataset", "http_status": 200, "worker_version": worker_version}]
+            [
+                {"kind": "/splits", "dataset": dataset, "http_status": 200, "worker_version": worker_version}
+                for dataset, worker_version in worker_versions.items()
+            ]
         )
         migration = MigrationAddJobRunnerVersionToCacheResponse(
             version="20230309141600", description="add 'job_runner_version' field based on 'worker_version' value"
         )
         migration.up()
-        result = db[CACHE_COLLECTION_RESPONSES].find_one({"dataset": "dataset"})
-        assert result
-        assert result["job_runner_version"] == expected
+        results = {
+            result["dataset"]: result["job_runner_version"]
+            for result in db[CACHE_COLLECTION_RESPONSES].find({}, {"dataset": 1, "job_runner_version": 1})
+        }
+        assert results == expected
         db[CACHE_COLLECTION_RESPONSES].drop()
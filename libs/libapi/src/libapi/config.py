@@ -37,6 +37,9 @@ API_HF_TIMEOUT_SECONDS = 0.2
 API_HF_WEBHOOK_SECRET = None
 API_MAX_AGE_LONG = 120  # 2 minutes
 API_MAX_AGE_SHORT = 10  # 10 seconds
+API_RESPONSE_CACHE_MAX_BYTES = 10_000_000
+API_RESPONSE_CACHE_MAX_STALE_SECONDS = 3_600  # 1 hour
+API_RESPONSE_CACHE_TTL_SECONDS = 30
 
 
 @dataclass(frozen=True)
@@ -50,6 +53,9 @@ class ApiConfig:
     hf_webhook_secret: Optional[str] = API_HF_WEBHOOK_SECRET
     max_age_long: int = API_MAX_AGE_LONG
     max_age_short: int = API_MAX_AGE_SHORT
+    response_cache_max_bytes: int = API_RESPONSE_CACHE_MAX_BYTES
+    response_cache_max_stale_seconds: int = API_RESPONSE_CACHE_MAX_STALE_SECONDS
+    response_cache_ttl_seconds: int = API_RESPONSE_CACHE_TTL_SECONDS
 
     @classmethod
     def from_env(cls, hf_endpoint: str) -> "ApiConfig":
@@ -69,4 +75,13 @@ class ApiConfig:
                 hf_webhook_secret=env.str(name="HF_WEBHOOK_SECRET", default=API_HF_WEBHOOK_SECRET),
                 max_age_long=env.int(name="MAX_AGE_LONG", default=API_MAX_AGE_LONG),
                 max_age_short=env.int(name="MAX_AGE_SHORT", default=API_MAX_AGE_SHORT),
+                response_cache_max_bytes=env.int(
+                    name="RESPONSE_CACHE_MAX_BYTES", default=API_RESPONSE_CACHE_MAX_BYTES
+                ),
+                response_cache_max_stale_seconds=env.int(
+                    name="RESPONSE_CACHE_MAX_STALE_SECONDS", default=API_RESPONSE_CACHE_MAX_STALE_SECONDS
+                ),
+                response_cache_ttl_seconds=env.int(
+                    name="RESPONSE_CACHE_TTL_SECONDS", default=API_RESPONSE_CACHE_TTL_SECONDS
+                ),
             )
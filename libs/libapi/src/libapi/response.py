@@ -1,15 +1,39 @@
 import logging
+from collections import OrderedDict
 from typing import Optional
 
 import pyarrow as pa
 from datasets import Features
 from libcommon.constants import MAX_NUM_ROWS_PER_PAGE, ROW_IDX_COLUMN
-from libcommon.dtos import PaginatedResponse
+from libcommon.dtos import FeatureItem, PaginatedResponse
 from libcommon.storage_client import StorageClient
 from libcommon.viewer_utils.features import to_features_list
 
 from libapi.utils import to_rows_list
 
+# the features of a split don't change for a given revision: their list is only computed once
+FEATURES_LIST_CACHE_MAX_SIZE = 512
+# (dataset, config, split) -> (revision, features, features list). Only accessed from the event loop: no lock needed.
+features_list_cache: OrderedDict[tuple[str, str, str], tuple[str, Features, list[FeatureItem]]] = OrderedDict()
+
+
+def get_features_list(dataset: str, revision: str, config: str, split: str, features: Features) -> list[FeatureItem]:
+    key = (dataset, config, split)
+    cached_content = features_list_cache.get(key)
+    if cached_content is not None:
+        cached_revision, cached_features, cached_features_list = cached_content
+        # comparing the features is cheaper than converting them, and protects against different sources of features
+        # for the same split (e.g. the parquet files and the duckdb index)
+        if cached_revision == revision and cached_features == features:
+            features_list_cache.move_to_end(key)
+            return cached_features_list
+    features_list = to_features_list(features)
+    features_list_cache[key] = (revision, features, features_list)
+    features_list_cache.move_to_end(key)
+    while len(features_list_cache) > FEATURES_LIST_CACHE_MAX_SIZE:
+        features_list_cache.popitem(last=False)
+    return features_list
+
 
 async def create_response(
     dataset: str,
@@ -26,15 +50,20 @@ async def create_response(
     use_row_idx_column: bool = False,
     truncated_columns: Optional[list[str]] = None,
 ) -> PaginatedResponse:
-    if set(pa_table.column_names).intersection(set(unsupported_columns)):
-        raise RuntimeError(
-            "The pyarrow table contains unsupported columns. They should have been ignored in the row group reader."
-        )
+    if unsupported_columns:
+        unsupported_columns_set = set(unsupported_columns)
+        if any(column in unsupported_columns_set for column in pa_table.column_names):
+            raise RuntimeError(
+                "The pyarrow table contains unsupported columns. They should have been ignored in the row group"
+                " reader."
+            )
     logging.debug(f"create response for {dataset=} {config=} {split=}")
     return {
         "features": [
             feature_item
-            for feature_item in to_features_list(features)
+            for feature_item in get_features_list(
+                dataset=dataset, revision=revision, config=config, split=split, features=features
+            )
             if not use_row_idx_column or feature_item["name"] != ROW_IDX_COLUMN
         ],
         "rows": await to_rows_list(
@@ -46,7 +75,6 @@ async def create_response(
             storage_client=storage_client,
             offset=offset,
             features=features,
-            unsupported_columns=unsupported_columns,
             row_idx_column=ROW_IDX_COLUMN if use_row_idx_column else None,
             truncated_columns=truncated_columns,
         ),
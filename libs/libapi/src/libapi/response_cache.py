@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 The HuggingFace Authors.
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Optional
+
+# a single response cannot take more than this fraction of the cache, so that it does not evict all the other entries
+MAX_ENTRY_BYTES_RATIO = 0.1
+
+
+@dataclass
+class ResponseCacheEntry:
+    revision: str
+    content: bytes
+    created_at: float
+
+
+class ResponseCache:
+    """A process-local LRU cache for the serialized (JSON) content of the API responses.
+
+    The entries are stored with the dataset revision they were computed for: they are only returned for the same
+    revision, and until they are older than `ttl_seconds`. The expired entries are kept until they are evicted, so
+    that they can be served as a fallback if the response cannot be computed (see `get_stale`), until they are older
+    than `max_stale_seconds`. It must be shorter than the expiration of the signed URLs (CloudFront), so that the
+    assets URLs in a stale response are still valid.
+
+    The cache is limited by the total size of the serialized responses, not by their number, since the size of a
+    response can vary a lot (e.g. the number of columns, or the size of the cells). The responses bigger than
+    `MAX_ENTRY_BYTES_RATIO * max_bytes` are not cached.
+
+    Since the cache is only accessed from the event loop, it does not need any lock.
+
+    Args:
+        max_bytes (`int`): the maximum total size of the cached responses, in bytes. If 0, the cache is disabled.
+        ttl_seconds (`float`): the time-to-live of the entries, in seconds. If 0, the cache is disabled.
+        max_stale_seconds (`float`, *optional*): the maximum age of an entry served as a fallback, in seconds. If 0,
+          the stale entries are never served. Defaults to 0.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float, max_stale_seconds: float = 0) -> None:
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = int(max_bytes * MAX_ENTRY_BYTES_RATIO)
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.num_bytes = 0
+        self._entries: OrderedDict[Hashable, ResponseCacheEntry] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable, revision: str) -> Optional[bytes]:
+        """Get the serialized content of a cached response.
+
+        Args:
+            key (`Hashable`): the key of the response, built from the request parameters.
+            revision (`str`): the current revision of the dataset.
+
+        Returns:
+            `bytes`, *optional*: the cached content, or None if there is no fresh entry for this revision.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.revision != revision:
+            # the response is outdated, it must not be served anymore, even as a fallback
+            self._delete(key)
+            return None
+        if time.monotonic() - entry.created_at > self.ttl_seconds:
+            return None
+        self._entries.move_to_end(key)
+        return entry.content
+
+    def get_stale(self, key: Hashable) -> Optional[ResponseCacheEntry]:
+        """Get the last cached response, even if it has expired.
+
+        Only meant to be used as a fallback when the response cannot be computed (e.g. the database is not
+        reachable), since the current revision of the dataset cannot be checked.
+
+        Args:
+            key (`Hashable`): the key of the response, built from the request parameters.
+
+        Returns:
+            `ResponseCacheEntry`, *optional*: the last cached entry, or None if there is none, or if it is older than
+              `max_stale_seconds`.
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.created_at > self.max_stale_seconds:
+            return None
+        return entry
+
+    def set(self, key: Hashable, revision: str, content: bytes) -> None:
+        """Store the serialized content of a response.
+
+        Args:
+            key (`Hashable`): the key of the response, built from the request parameters.
+            revision (`str`): the revision of the dataset used to compute the response.
+            content (`bytes`): the content of the response, serialized to JSON.
+        """
+        if not self.enabled:
+            return
+        if key in self._entries:
+            self._delete(key)
+        if len(content) > self.max_entry_bytes:
+            return
+        self._entries[key] = ResponseCacheEntry(revision=revision, content=content, created_at=time.monotonic())
+        self.num_bytes += len(content)
+        while self.num_bytes > self.max_bytes:
+            _, evicted_entry = self._entries.popitem(last=False)
+            self.num_bytes -= len(evicted_entry.content)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.num_bytes = 0
+
+    def _delete(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.num_bytes -= len(entry.content)
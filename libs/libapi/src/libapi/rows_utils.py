@@ -7,41 +7,33 @@ from typing import Any, Optional
 
 import anyio
 from datasets import Features
+from datasets.features.features import FeatureType
 from libcommon.dtos import Row
 from libcommon.storage_client import StorageClient
-from libcommon.viewer_utils.features import get_cell_value
+from libcommon.viewer_utils.features import get_cell_value, is_passthrough_feature
 from tqdm.contrib.concurrent import thread_map
 
 
-def _transform_row(
-    row_idx_and_row: tuple[int, Row],
+def _transform_cell(
+    task: tuple[str, FeatureType, int, Any],
     dataset: str,
     revision: str,
     config: str,
     split: str,
-    features: Features,
     storage_client: StorageClient,
-    offset: int,
-    row_idx_column: Optional[str],
-) -> Row:
-    row_idx, row = row_idx_and_row
-    transformed_row = {
-        featureName: get_cell_value(
-            dataset=dataset,
-            revision=revision,
-            config=config,
-            split=split,
-            row_idx=offset + row_idx if row_idx_column is None else row[row_idx_column],
-            cell=row[featureName] if featureName in row else None,
-            featureName=featureName,
-            fieldType=fieldType,
-            storage_client=storage_client,
-        )
-        for (featureName, fieldType) in features.items()
-    }
-    if row_idx_column and row_idx_column not in transformed_row:
-        transformed_row |= {row_idx_column: row[row_idx_column]}
-    return transformed_row
+) -> Any:
+    featureName, fieldType, row_idx, cell = task
+    return get_cell_value(
+        dataset=dataset,
+        revision=revision,
+        config=config,
+        split=split,
+        row_idx=row_idx,
+        cell=cell,
+        featureName=featureName,
+        fieldType=fieldType,
+        storage_client=storage_client,
+    )
 
 
 async def transform_rows(
@@ -49,33 +41,68 @@ async def transform_rows(
     revision: str,
     config: str,
     split: str,
-    rows: list[Row],
+    columns: dict[str, list[Any]],
+    num_rows: int,
     features: Features,
     storage_client: StorageClient,
     offset: int,
     row_idx_column: Optional[str],
 ) -> list[Row]:
-    fn = partial(
-        _transform_row,
-        dataset=dataset,
-        revision=revision,
-        config=config,
-        split=split,
-        features=features,
-        storage_client=storage_client,
-        offset=offset,
-        row_idx_column=row_idx_column,
-    )
-    if "Audio(" in str(features) or "Image(" in str(features):
+    """Transform the cells, if needed (e.g. save the images or audio to the assets, and return their URL).
+
+    The transformation is done column by column: the columns that don't contain any Image or Audio are returned
+    as is, and only the cells of the other columns are transformed.
+
+    Args:
+        dataset (`str`): the dataset name
+        revision (`str`): the dataset revision
+        config (`str`): the config name
+        split (`str`): the split name
+        columns (`dict[str, list[Any]]`): the cells, column by column (as returned by `pa.Table.to_pydict()`)
+        num_rows (`int`): the number of rows
+        features (`Features`): the features of the rows. The missing columns are filled with None values.
+        storage_client (`StorageClient`): the storage client, used to create the assets
+        offset (`int`): the index of the first row, used as the row index if `row_idx_column` is None
+        row_idx_column (`str`, *optional*): the name of the column that contains the row index
+
+    Returns:
+        `list[Row]`: the transformed rows
+    """
+    row_indices = columns[row_idx_column] if row_idx_column else range(offset, offset + num_rows)
+    transformed_columns: dict[str, list[Any]] = {}
+    tasks: list[tuple[str, FeatureType, int, Any]] = []
+    for featureName, fieldType in features.items():
+        if featureName not in columns:
+            transformed_columns[featureName] = [None] * num_rows
+        elif is_passthrough_feature(fieldType):
+            transformed_columns[featureName] = columns[featureName]
+        else:
+            transformed_columns[featureName] = []
+            tasks.extend(
+                (featureName, fieldType, row_idx, cell) for row_idx, cell in zip(row_indices, columns[featureName])
+            )
+    if row_idx_column and row_idx_column not in transformed_columns:
+        transformed_columns[row_idx_column] = columns[row_idx_column]
+
+    if tasks:
+        fn = partial(
+            _transform_cell,
+            dataset=dataset,
+            revision=revision,
+            config=config,
+            split=split,
+            storage_client=storage_client,
+        )
         # Use multithreading to parallelize image/audio files uploads.
         # Also multithreading is ok to convert audio data
         # (we use pydub which might spawn one ffmpeg process per conversion, which releases the GIL)
-        desc = f"_transform_row for {dataset}"
-        _thread_map = partial(thread_map, desc=desc, total=len(rows))
-        return await anyio.to_thread.run_sync(_thread_map, fn, enumerate(rows))
-    else:
-
-        def _map(func: Callable[[Any], Any], *iterables: Any) -> list[Row]:
-            return list(map(func, *iterables))
+        desc = f"_transform_cell for {dataset}"
+        _thread_map: Callable[..., list[Any]] = partial(thread_map, desc=desc, total=len(tasks))
+        transformed_cells = await anyio.to_thread.run_sync(_thread_map, fn, tasks)
+        for (featureName, _, _, _), transformed_cell in zip(tasks, transformed_cells):
+            transformed_columns[featureName].append(transformed_cell)
 
-        return await anyio.to_thread.run_sync(_map, fn, enumerate(rows))
+    column_names = list(transformed_columns)
+    if not column_names:
+        return [{} for _ in range(num_rows)]
+    return [dict(zip(column_names, values)) for values in zip(*transformed_columns.values())]
@@ -43,14 +43,12 @@ def get_response(content: Any, status_code: int = 200, max_age: int = 0) -> Resp
     return OrjsonResponse(content=content, status_code=status_code, headers=headers)
 
 
-def get_json_response(
-    content: Any,
-    status_code: HTTPStatus = HTTPStatus.OK,
+def get_json_headers(
     max_age: int = 0,
     error_code: Optional[str] = None,
     revision: Optional[str] = None,
     headers: Optional[dict[str, str]] = None,
-) -> Response:
+) -> dict[str, str]:
     if not headers:
         headers = {}
     headers["Cache-Control"] = f"max-age={max_age}" if max_age > 0 else "no-store"
@@ -58,11 +56,24 @@ def get_json_response(
         headers["X-Error-Code"] = error_code
     if revision is not None:
         headers["X-Revision"] = revision
+    return headers
+
+
+def get_json_response(
+    content: Any,
+    status_code: HTTPStatus = HTTPStatus.OK,
+    max_age: int = 0,
+    error_code: Optional[str] = None,
+    revision: Optional[str] = None,
+    headers: Optional[dict[str, str]] = None,
+) -> Response:
+    headers = get_json_headers(max_age=max_age, error_code=error_code, revision=revision, headers=headers)
     return OrjsonResponse(content=content, status_code=status_code.value, headers=headers)
 
 
 # these headers are exposed to the client (browser)
 EXPOSED_HEADERS = [
+    "X-Cache",
     "X-Error-Code",
     "X-Revision",
 ]
@@ -74,6 +85,14 @@ def get_json_ok_response(
     return get_json_response(content=content, max_age=max_age, revision=revision, headers=headers)
 
 
+def get_serialized_json_ok_response(
+    content: bytes, max_age: int = 0, revision: Optional[str] = None, headers: Optional[dict[str, str]] = None
+) -> Response:
+    """Same as get_json_ok_response, for a content already serialized with orjson_dumps (e.g. a cached response)."""
+    headers = get_json_headers(max_age=max_age, revision=revision, headers=headers)
+    return Response(content=content, status_code=HTTPStatus.OK.value, headers=headers, media_type="application/json")
+
+
 def get_json_error_response(
     content: Any,
     status_code: HTTPStatus = HTTPStatus.OK,
@@ -205,23 +224,21 @@ async def to_rows_list(
     split: str,
     offset: int,
     features: Features,
-    unsupported_columns: list[str],
     storage_client: StorageClient,
     row_idx_column: Optional[str] = None,
     truncated_columns: Optional[list[str]] = None,
 ) -> list[RowItem]:
     num_rows = pa_table.num_rows
-    for idx, (column, feature) in enumerate(features.items()):
-        if column in unsupported_columns:
-            pa_table = pa_table.add_column(idx, column, pa.array([None] * num_rows))
     # transform the rows, if needed (e.g. save the images or audio to the assets, and return their URL)
+    # the columns that are not in the table (e.g. the unsupported columns) are filled with None values
     try:
         transformed_rows = await transform_rows(
             dataset=dataset,
             revision=revision,
             config=config,
             split=split,
-            rows=pa_table.to_pylist(),
+            columns=pa_table.to_pydict(),
+            num_rows=num_rows,
             features=features,
             storage_client=storage_client,
             offset=offset,
@@ -231,11 +248,14 @@ async def to_rows_list(
         raise TransformRowsProcessingError(
             "Server error while post-processing the split rows. Please report the issue."
         ) from err
+    # the same list is shared by all the rows: it's only serialized
+    truncated_cells = truncated_columns or []
+    if row_idx_column is None:
+        return [
+            {"row_idx": idx, "row": row, "truncated_cells": truncated_cells}
+            for idx, row in enumerate(transformed_rows, start=offset)
+        ]
     return [
-        {
-            "row_idx": idx + offset if row_idx_column is None else row.pop(row_idx_column),
-            "row": row,
-            "truncated_cells": truncated_columns or [],
-        }
-        for idx, row in enumerate(transformed_rows)
+        {"row_idx": row.pop(row_idx_column), "row": row, "truncated_cells": truncated_cells}
+        for row in transformed_rows
     ]
@@ -8,6 +8,7 @@ from datasets import Dataset, Image
 from datasets.table import embed_table_storage
 from libcommon.constants import ROW_IDX_COLUMN
 from libcommon.storage_client import StorageClient
+from libcommon.viewer_utils.features import to_features_list
 from PIL import Image as PILImage
 
 from libapi.response import create_response
@@ -113,3 +114,24 @@ async def test_create_response_with_image(image_path: str, storage_client: Stora
     assert storage_client.exists(image_key)
     image = PILImage.open(f"{storage_client.storage_root}/{image_key}")
     assert image is not None
+
+
+async def test_create_response_with_other_features(storage_client: StorageClient) -> None:
+    for ds in [
+        Dataset.from_dict({"text": ["Hello there", "General Kenobi"]}),
+        Dataset.from_dict({"number": [1, 2]}),
+    ]:
+        response = await create_response(
+            dataset="ds_other_features",
+            revision="revision",
+            config="default",
+            split="train",
+            storage_client=storage_client,
+            pa_table=ds.data,
+            offset=0,
+            features=ds.features,
+            unsupported_columns=[],
+            num_rows_total=2,
+            partial=False,
+        )
+        assert response["features"] == to_features_list(ds.features)
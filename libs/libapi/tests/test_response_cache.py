@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 The HuggingFace Authors.
+
+import time
+
+from libapi.response_cache import ResponseCache
+
+
+def test_response_cache() -> None:
+    response_cache = ResponseCache(max_bytes=1_000, ttl_seconds=60)
+    assert response_cache.get("a", revision="r1") is None
+    response_cache.set("a", revision="r1", content=b'{"rows":[1]}')
+    assert response_cache.get("a", revision="r1") == b'{"rows":[1]}'
+    # another revision is a cache miss, and evicts the outdated entry
+    assert response_cache.get("a", revision="r2") is None
+    assert response_cache.get("a", revision="r1") is None
+    assert response_cache.num_bytes == 0
+
+
+def test_response_cache_lru() -> None:
+    response_cache = ResponseCache(max_bytes=300, ttl_seconds=60)
+    response_cache.set("a", revision="r", content=b"a" * 30)
+    response_cache.set("b", revision="r", content=b"b" * 30)
+    assert response_cache.get("a", revision="r") == b"a" * 30
+    for key in "cdefghijk":
+        response_cache.set(key, revision="r", content=key.encode() * 30)
+    # "b" was the least recently used entry
+    assert response_cache.get("b", revision="r") is None
+    assert response_cache.get("a", revision="r") == b"a" * 30
+    assert response_cache.get("k", revision="r") == b"k" * 30
+    assert response_cache.num_bytes == 300
+
+
+def test_response_cache_max_bytes() -> None:
+    response_cache = ResponseCache(max_bytes=100, ttl_seconds=60)
+    response_cache.set("a", revision="r", content=b"a" * 10)
+    # the responses bigger than a tenth of the cache are not stored
+    response_cache.set("b", revision="r", content=b"b" * 11)
+    assert response_cache.get("a", revision="r") == b"a" * 10
+    assert response_cache.get("b", revision="r") is None
+    # replacing an entry updates the size of the cache
+    response_cache.set("a", revision="r", content=b"a" * 5)
+    assert response_cache.num_bytes == 5
+    response_cache.set("a", revision="r", content=b"a" * 11)
+    assert response_cache.get("a", revision="r") is None
+    assert response_cache.num_bytes == 0
+
+
+def test_response_cache_ttl() -> None:
+    response_cache = ResponseCache(max_bytes=1_000, ttl_seconds=0.1)
+    response_cache.set("a", revision="r", content=b"a")
+    assert response_cache.get("a", revision="r") == b"a"
+    time.sleep(0.2)
+    assert response_cache.get("a", revision="r") is None
+
+
+def test_response_cache_disabled() -> None:
+    response_cache = ResponseCache(max_bytes=0, ttl_seconds=60)
+    response_cache.set("a", revision="r", content=b"a")
+    assert response_cache.get("a", revision="r") is None
+
+
+def test_response_cache_get_stale() -> None:
+    response_cache = ResponseCache(max_bytes=1_000, ttl_seconds=0.1, max_stale_seconds=60)
+    assert response_cache.get_stale("a") is None
+    response_cache.set("a", revision="r", content=b"a")
+    time.sleep(0.2)
+    assert response_cache.get("a", revision="r") is None
+    # the expired entry can still be used as a fallback
+    entry = response_cache.get_stale("a")
+    assert entry is not None
+    assert entry.revision == "r"
+    assert entry.content == b"a"
+    # but not once a new revision has been seen
+    assert response_cache.get("a", revision="r2") is None
+    assert response_cache.get_stale("a") is None
+
+
+def test_response_cache_get_stale_max_stale_seconds() -> None:
+    response_cache = ResponseCache(max_bytes=1_000, ttl_seconds=0.1, max_stale_seconds=0.3)
+    response_cache.set("a", revision="r", content=b"a")
+    time.sleep(0.2)
+    assert response_cache.get_stale("a") is not None
+    # the entries older than max_stale_seconds are not served anymore
+    time.sleep(0.2)
+    assert response_cache.get_stale("a") is None
+
+
+def test_response_cache_get_stale_disabled() -> None:
+    response_cache = ResponseCache(max_bytes=1_000, ttl_seconds=0.1)
+    response_cache.set("a", revision="r", content=b"a")
+    time.sleep(0.2)
+    assert response_cache.get_stale("a") is None
@@ -9,6 +9,10 @@ from typing import Literal, Optional
 from environs import Env
 from marshmallow.validate import OneOf
 
+# a single parser is shared by all the configs: the variables are read from os.environ on every call, and the prefix
+# is only set for the duration of the `prefixed` context manager
+_ENV = Env(expand_vars=True)
+
 STORAGE_PROTOCOL_VALUES: list[str] = ["file", "s3"]
 StorageProtocol = Literal["file", "s3"]
 
@@ -25,7 +29,7 @@ class AssetsConfig:
 
     @classmethod
     def from_env(cls) -> "AssetsConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("ASSETS_"):
             return cls(
                 base_url=env.str(name="BASE_URL", default=ASSETS_BASE_URL),
@@ -51,7 +55,7 @@ class S3Config:
 
     @classmethod
     def from_env(cls) -> "S3Config":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("S3_"):
             return cls(
                 access_key_id=env.str(name="ACCESS_KEY_ID", default=S3_ACCESS_KEY_ID),
@@ -73,7 +77,7 @@ class CachedAssetsConfig:
 
     @classmethod
     def from_env(cls) -> "CachedAssetsConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("CACHED_ASSETS_"):
             return cls(
                 base_url=env.str(name="BASE_URL", default=CACHED_ASSETS_BASE_URL),
@@ -101,7 +105,7 @@ class CloudFrontConfig:
 
     @classmethod
     def from_env(cls) -> "CloudFrontConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("CLOUDFRONT_"):
             return cls(
                 expiration_seconds=env.int(name="EXPIRATION_SECONDS", default=CLOUDFRONT_EXPIRATION_SECONDS),
@@ -119,7 +123,7 @@ class ParquetMetadataConfig:
 
     @classmethod
     def from_env(cls) -> "ParquetMetadataConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("PARQUET_METADATA_"):
             return cls(
                 storage_directory=env.str(name="STORAGE_DIRECTORY", default=PARQUET_METADATA_STORAGE_DIRECTORY),
@@ -135,7 +139,7 @@ class RowsIndexConfig:
 
     @classmethod
     def from_env(cls) -> "RowsIndexConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("ROWS_INDEX_"):
             return cls(
                 max_arrow_data_in_memory=env.int(
@@ -159,7 +163,7 @@ class CommonConfig:
 
     @classmethod
     def from_env(cls) -> "CommonConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("COMMON_"):
             return cls(
                 blocked_datasets=env.list(name="BLOCKED_DATASETS", default=COMMON_BLOCKED_DATASETS.copy()),
@@ -180,7 +184,7 @@ class LogConfig:
 
     @classmethod
     def from_env(cls) -> "LogConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("LOG_"):
             return cls(
                 level=env.log_level(name="LEVEL", default=LOG_LEVEL),
@@ -198,7 +202,7 @@ class CacheConfig:
 
     @classmethod
     def from_env(cls) -> "CacheConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("CACHE_"):
             return cls(
                 mongo_database=env.str(name="MONGO_DATABASE", default=CACHE_MONGO_DATABASE),
@@ -217,7 +221,7 @@ class QueueConfig:
 
     @classmethod
     def from_env(cls) -> "QueueConfig":
-        env = Env(expand_vars=True)
+        env = _ENV
         with env.prefixed("QUEUE_"):
             return cls(
                 mongo_database=env.str(name="MONGO_DATABASE", default=QUEUE_MONGO_DATABASE),
@@ -8,6 +8,7 @@ PARQUET_METADATA_CACHE_APPNAME = "datasets_server_parquet_metadata"
 DESCRIPTIVE_STATISTICS_CACHE_APPNAME = "dataset_viewer_descriptive_statistics"
 DUCKDB_INDEX_CACHE_APPNAME = "dataset_viewer_duckdb_index"
 DUCKDB_INDEX_JOB_RUNNER_SUBDIRECTORY = "job_runner"
+CLEAN_DIR_MAX_WORKERS = 8
 CACHE_METRICS_COLLECTION = "cacheTotalMetric"
 TYPE_AND_STATUS_JOB_COUNTS_COLLECTION = "jobTotalMetric"
 WORKER_TYPE_JOB_COUNTS_COLLECTION = "workerTypeJobCounts"
@@ -64,7 +65,6 @@ CONFIG_INFO_KIND = "config-info"
 CONFIG_PARQUET_METADATA_KIND = "config-parquet-metadata"
 CONFIG_SPLIT_NAMES_KIND = "config-split-names"
 DATASET_CONFIG_NAMES_KIND = "dataset-config-names"
-DATASET_INFO_KIND = "dataset-info"
 SPLIT_DUCKDB_INDEX_KIND = "split-duckdb-index"
 SPLIT_HAS_PREVIEW_KIND = "split-first-rows"
 SPLIT_HAS_SEARCH_KIND = "split-duckdb-index"
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Literal, Optional, TypedDict, Union
 
 import numpy as np
+import numpy.typing as npt
 import pyarrow as pa
 import pyarrow.compute as pc
 import pyarrow.parquet as pq
@@ -139,17 +140,59 @@ def is_list_pa_type(parquet_file_path: Path, feature_name: str) -> bool:
     return is_list
 
 
+def _get_row_groups_to_read(
+    row_group_offsets: npt.NDArray[np.int64], first_row: int, last_row: int
+) -> tuple[int, int, int]:
+    """Get the row groups that contain the rows from `first_row` to `last_row` (included).
+
+    Args:
+        row_group_offsets (`npt.NDArray[np.int64]`): the cumulative number of rows at the end of each row group.
+        first_row (`int`): the first row to read.
+        last_row (`int`): the last row to read.
+
+    Returns:
+        `tuple[int, int, int]`: the ids of the first and last row groups to read, and the number of rows to read in
+          the last row group (the rows after `last_row` are not needed: they are not decoded).
+    """
+    first_row_group_id, last_row_group_id = np.searchsorted(row_group_offsets, [first_row, last_row], side="right")
+    first_row_in_last_row_group = row_group_offsets[last_row_group_id - 1] if last_row_group_id > 0 else 0
+    return int(first_row_group_id), int(last_row_group_id), int(last_row + 1 - first_row_in_last_row_group)
+
+
 @dataclass
 class RowGroupReader:
     parquet_file: pq.ParquetFile
     group_id: int
     features: Features
 
-    def read(self, columns: list[str]) -> pa.Table:
-        return self.parquet_file.read_row_group(i=self.group_id, columns=columns)
+    def read(self, columns: list[str], num_rows: Optional[int] = None) -> pa.Table:
+        """Read the row group.
 
-    def read_truncated_binary(self, columns: list[str], max_binary_length: int) -> tuple[pa.Table, list[str]]:
-        pa_table = self.parquet_file.read_row_group(i=self.group_id, columns=columns)
+        Args:
+            columns (`list[str]`): the columns to read.
+            num_rows (`int`, *optional*): if set, only the first `num_rows` rows of the row group are decoded
+              (it's used for the last row group of a query, which often only needs a few rows).
+
+        Returns:
+            `pa.Table`: the rows of the row group.
+        """
+        if num_rows is None or num_rows >= self.parquet_file.metadata.row_group(self.group_id).num_rows:
+            return self.parquet_file.read_row_group(i=self.group_id, columns=columns)
+        batches: list[pa.RecordBatch] = []
+        num_read_rows = 0
+        for batch in self.parquet_file.iter_batches(
+            batch_size=max(num_rows, 1), row_groups=[self.group_id], columns=columns
+        ):
+            batches.append(batch)
+            num_read_rows += batch.num_rows
+            if num_read_rows >= num_rows:
+                break
+        return pa.Table.from_batches(batches)
+
+    def read_truncated_binary(
+        self, columns: list[str], max_binary_length: int, num_rows: Optional[int] = None
+    ) -> tuple[pa.Table, list[str]]:
+        pa_table = self.read(columns=columns, num_rows=num_rows)
         truncated_columns: list[str] = []
         if max_binary_length:
             for field_idx, field in enumerate(pa_table.schema):
@@ -284,8 +327,8 @@ class ParquetIndexWithMetadata:
             first_row = min(parquet_offset, last_row_in_parquet)
             last_row = min(parquet_offset + length - 1, last_row_in_parquet)
 
-            first_row_group_id, last_row_group_id = np.searchsorted(
-                row_group_offsets, [first_row, last_row], side="right"
+            first_row_group_id, last_row_group_id, num_rows_in_last_row_group = _get_row_groups_to_read(
+                row_group_offsets, first_row=first_row, last_row=last_row
             )
 
         with StepProfiler(
@@ -327,11 +370,13 @@ class ParquetIndexWithMetadata:
                 truncated_columns: set[str] = set()
                 for i in range(first_row_group_id, last_row_group_id + 1):
                     rg_pa_table, rg_truncated_columns = row_group_readers[i].read_truncated_binary(
-                        self.supported_columns, max_binary_length=max_binary_length
+                        self.supported_columns,
+                        max_binary_length=max_binary_length,
+                        num_rows=num_rows_in_last_row_group if i == last_row_group_id else None,
                     )
                     pa_tables.append(rg_pa_table)
                     truncated_columns |= set(rg_truncated_columns)
-                pa_table = pa.concat_tables(pa_tables)
+                pa_table = pa_tables[0] if len(pa_tables) == 1 else pa.concat_tables(pa_tables)
             except ArrowInvalid as err:
                 raise SchemaMismatchError("Parquet files have different schema.", err)
             first_row_in_pa_table = row_group_offsets[first_row_group_id - 1] if first_row_group_id > 0 else 0
@@ -416,8 +461,8 @@ class ParquetIndexWithMetadata:
             first_row = min(parquet_offset, last_row_in_parquet)
             last_row = min(parquet_offset + length - 1, last_row_in_parquet)
 
-            first_row_group_id, last_row_group_id = np.searchsorted(
-                row_group_offsets, [first_row, last_row], side="right"
+            first_row_group_id, last_row_group_id, num_rows_in_last_row_group = _get_row_groups_to_read(
+                row_group_offsets, first_row=first_row, last_row=last_row
             )
 
         with StepProfiler(
@@ -434,12 +479,21 @@ class ParquetIndexWithMetadata:
 
         with StepProfiler(method="parquet_index_with_metadata.query", step="read the row groups"):
             try:
-                pa_table = pa.concat_tables(
-                    [
-                        row_group_readers[i].read(self.supported_columns)
-                        for i in range(first_row_group_id, last_row_group_id + 1)
-                    ]
-                )
+                if first_row_group_id == last_row_group_id:
+                    # most queries fit in a single row group: no need to concatenate
+                    pa_table = row_group_readers[first_row_group_id].read(
+                        self.supported_columns, num_rows=num_rows_in_last_row_group
+                    )
+                else:
+                    pa_table = pa.concat_tables(
+                        [
+                            row_group_readers[i].read(
+                                self.supported_columns,
+                                num_rows=num_rows_in_last_row_group if i == last_row_group_id else None,
+                            )
+                            for i in range(first_row_group_id, last_row_group_id + 1)
+                        ]
+                    )
             except ArrowInvalid as err:
                 raise SchemaMismatchError("Parquet files have different schema.", err)
             first_row_in_pa_table = row_group_offsets[first_row_group_id - 1] if first_row_group_id > 0 else 0
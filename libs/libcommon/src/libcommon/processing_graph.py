@@ -163,6 +163,7 @@ class ProcessingGraph:
     _first_processing_steps: list[ProcessingStep] = field(init=False)
     _topologically_ordered_processing_steps: list[ProcessingStep] = field(init=False)
     _alphabetically_ordered_processing_steps: list[ProcessingStep] = field(init=False)
+    _ancestor_names_by_processing_step_name: Mapping[str, list[str]] = field(init=False)
 
     def __post_init__(self) -> None:
         _nx_graph = nx.DiGraph()
@@ -223,6 +224,11 @@ class ProcessingGraph:
         self._alphabetically_ordered_processing_steps = [
             self.get_processing_step(processing_step_name) for processing_step_name in sorted(_nx_graph.nodes())
         ]
+        # the graph is immutable: compute the ancestors once, instead of traversing the graph on every call
+        self._ancestor_names_by_processing_step_name = {
+            processing_step_name: list(nx.ancestors(_nx_graph, processing_step_name))
+            for processing_step_name in _nx_graph.nodes()
+        }
         if self.check_one_of_parents_is_same_or_higher_level:
             check_one_of_parents_is_same_or_higher_level(self)
 
@@ -330,11 +336,10 @@ class ProcessingGraph:
             `list[ProcessingStep]`: The list of ancestor processing steps
         """
         try:
-            return [
-                self.get_processing_step(ancestor) for ancestor in nx.ancestors(self._nx_graph, processing_step_name)
-            ]
-        except nx.NetworkXError as e:
+            ancestor_names = self._ancestor_names_by_processing_step_name[processing_step_name]
+        except KeyError as e:
             raise ProcessingStepDoesNotExist(f"Unknown processing step: {processing_step_name}") from e
+        return [self.get_processing_step(ancestor_name) for ancestor_name in ancestor_names]
 
     def get_first_processing_steps(self) -> list[ProcessingStep]:
         """
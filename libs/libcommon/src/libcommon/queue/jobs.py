@@ -34,6 +34,7 @@ from libcommon.queue.lock import lock, release_lock, release_locks
 from libcommon.queue.metrics import (
     decrease_metric,
     increase_metric,
+    increase_metrics,
     update_metrics_for_type,
 )
 from libcommon.queue.past_jobs import create_past_job
@@ -345,10 +346,7 @@ class Queue:
                 )
                 for job_info in job_infos
             ]
-            for job in jobs:
-                increase_metric(
-                    dataset=job.dataset, job_type=job.type, status=Status.WAITING, difficulty=job.difficulty
-                )
+            increase_metrics(jobs=[(job.dataset, job.type, job.difficulty) for job in jobs], status=Status.WAITING)
             job_ids = JobDocument.objects.insert(jobs, load_bulk=False)
             return len(job_ids)
         except Exception:
@@ -2,6 +2,8 @@
 # Copyright 2024 The HuggingFace Authors.
 
 import types
+from collections import Counter
+from collections.abc import Iterable
 from typing import Generic, TypeVar
 
 from bson import ObjectId
@@ -105,23 +107,31 @@ class WorkerSizeJobsCountDocument(Document):
     objects = QuerySetManager["WorkerSizeJobsCountDocument"]()
 
 
-def _update_metrics(dataset: str, job_type: str, status: str, increase_by: int, difficulty: int) -> None:
+def _increase_job_total_metric(job_type: str, status: str, increase_by: int) -> None:
     JobTotalMetricDocument.objects(job_type=job_type, status=status).update(
         upsert=True,
         write_concern={"w": "majority", "fsync": True},
         read_concern={"level": "majority"},
         inc__total=increase_by,
     )
+
+
+def _increase_worker_size_jobs_count(worker_size: WorkerSize, increase_by: int) -> None:
+    WorkerSizeJobsCountDocument.objects(worker_size=worker_size).update(
+        upsert=True,
+        write_concern={"w": "majority", "fsync": True},
+        read_concern={"level": "majority"},
+        inc__jobs_count=increase_by,
+    )
+
+
+def _update_metrics(dataset: str, job_type: str, status: str, increase_by: int, difficulty: int) -> None:
+    _increase_job_total_metric(job_type=job_type, status=status, increase_by=increase_by)
     if status == Status.WAITING:
         # Do not consider blocked datasets for auto-scaling metrics
         if not is_blocked(dataset):
             worker_size = WorkerSizeJobsCountDocument.get_worker_size(difficulty=difficulty)
-            WorkerSizeJobsCountDocument.objects(worker_size=worker_size).update(
-                upsert=True,
-                write_concern={"w": "majority", "fsync": True},
-                read_concern={"level": "majority"},
-                inc__jobs_count=increase_by,
-            )
+            _increase_worker_size_jobs_count(worker_size=worker_size, increase_by=increase_by)
 
 
 def increase_metric(dataset: str, job_type: str, status: str, difficulty: int) -> None:
@@ -130,6 +140,34 @@ def increase_metric(dataset: str, job_type: str, status: str, difficulty: int) -
     )
 
 
+def increase_metrics(jobs: Iterable[tuple[str, str, int]], status: str) -> None:
+    """Increase the metrics for a batch of jobs with the same status.
+
+    Same as calling `increase_metric` for every job, but the metrics are updated once per job type and per worker
+    size, and the blockage of each dataset is only checked once.
+
+    Args:
+        jobs (`Iterable[tuple[str, str, int]]`): the (dataset, job type, difficulty) of each job.
+        status (`str`): the status of the jobs.
+    """
+    total_by_job_type: Counter[str] = Counter()
+    jobs_count_by_worker_size: Counter[WorkerSize] = Counter()
+    is_blocked_by_dataset: dict[str, bool] = {}
+    for dataset, job_type, difficulty in jobs:
+        total_by_job_type[job_type] += DEFAULT_INCREASE_AMOUNT
+        if status == Status.WAITING:
+            if dataset not in is_blocked_by_dataset:
+                is_blocked_by_dataset[dataset] = is_blocked(dataset)
+            # Do not consider blocked datasets for auto-scaling metrics
+            if not is_blocked_by_dataset[dataset]:
+                worker_size = WorkerSizeJobsCountDocument.get_worker_size(difficulty=difficulty)
+                jobs_count_by_worker_size[worker_size] += DEFAULT_INCREASE_AMOUNT
+    for job_type, total in total_by_job_type.items():
+        _increase_job_total_metric(job_type=job_type, status=status, increase_by=total)
+    for worker_size, jobs_count in jobs_count_by_worker_size.items():
+        _increase_worker_size_jobs_count(worker_size=worker_size, increase_by=jobs_count)
+
+
 def decrease_metric(dataset: str, job_type: str, status: str, difficulty: int) -> None:
     _update_metrics(
         dataset=dataset, job_type=job_type, status=status, increase_by=DEFAULT_DECREASE_AMOUNT, difficulty=difficulty
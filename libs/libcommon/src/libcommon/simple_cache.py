@@ -910,18 +910,54 @@ def fetch_names(dataset: str, config: Optional[str], cache_kind: str, names_fiel
         `list[str]`: The list of names.
     """
     try:
-        names = []
         response = get_response_with_details(kind=cache_kind, dataset=dataset, config=config)
-        for name_item in response["content"][names_field]:
-            name = name_item[name_field]
-            if not isinstance(name, str):
-                raise ValueError(f"Invalid name: {name}, type should be str, got: {type(name)}")
-            names.append(name)
-        return names
+        return _get_names(content=response["content"], names_field=names_field, name_field=name_field)
     except Exception:
         return []
 
 
+def fetch_names_by_config(dataset: str, cache_kind: str, names_field: str, name_field: str) -> dict[str, list[str]]:
+    """
+    Fetch the lists of names of all the configs of a dataset from the cache database, with one query.
+
+    Same as calling `fetch_names` for every config, ie: a config without a valid cache entry is ignored, and
+    exceptions are silently caught.
+
+    Args:
+        dataset (`str`): The dataset name.
+        cache_kind (`str`): The config-level cache kind to fetch, eg "config-split-names".
+        names_field (`str`): The name of the field containing the list of names, eg: "splits".
+        name_field (`str`): The name of the field containing the name, eg: "split".
+
+    Returns:
+        `dict[str, list[str]]`: The list of names, for each config.
+    """
+    names_by_config: dict[str, list[str]] = {}
+    try:
+        responses = CachedResponseDocument.objects(kind=cache_kind, dataset=dataset, split=None).only(
+            "config", "content"
+        )
+        for response in responses:
+            if response.config is None:
+                continue
+            try:
+                names_by_config[response.config] = _get_names(
+                    content=response.content, names_field=names_field, name_field=name_field
+                )
+            except Exception:
+                continue
+    except Exception:
+        return {}
+    return names_by_config
+
+
+def _get_names(content: Mapping[str, Any], names_field: str, name_field: str) -> list[str]:
+    names = [name_item[name_field] for name_item in content[names_field]]
+    if not all(isinstance(name, str) for name in names):
+        raise ValueError(f"Invalid names: {names}, type should be str")
+    return names
+
+
 def get_datasets_with_last_updated_kind(kind: str, days: int) -> list[str]:
     """
     Get the list of datasets for which an artifact of some kind has been updated in the last days.
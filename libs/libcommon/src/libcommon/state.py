@@ -2,9 +2,10 @@
 # Copyright 2023 The HuggingFace Authors.
 
 import logging
+from collections import defaultdict
 from dataclasses import InitVar, dataclass, field
 from itertools import islice
-from typing import Optional
+from typing import Any, Optional
 
 import pandas as pd
 
@@ -15,7 +16,7 @@ from libcommon.constants import (
 )
 from libcommon.processing_graph import Artifact, ProcessingGraph
 from libcommon.prometheus import StepProfiler
-from libcommon.simple_cache import CacheEntryMetadata, fetch_names
+from libcommon.simple_cache import CacheEntryMetadata, fetch_names, fetch_names_by_config
 
 # TODO: assets, cached_assets, parquet files
 
@@ -32,6 +33,27 @@ class UnexceptedSplitNamesError(IncoherentCacheError):
     pass
 
 
+def group_by_column(df: pd.DataFrame, column: str) -> defaultdict[Any, pd.DataFrame]:
+    """Split a dataframe into one dataframe per value of a column, in a single pass.
+
+    It replaces filtering the whole dataframe once per value, which is quadratic when building the states of datasets
+    with many configs or splits.
+
+    Args:
+        df (`pd.DataFrame`): The dataframe to split.
+        column (`str`): The column to group by. The rows with a null value in this column are ignored.
+
+    Returns:
+        `defaultdict[Any, pd.DataFrame]`: The dataframes by value of the column. The other values get an empty
+          dataframe with the same columns.
+    """
+    empty_df = df.head(0)
+    groups: defaultdict[Any, pd.DataFrame] = defaultdict(lambda: empty_df)
+    for value, group_df in df.groupby(column, sort=False):
+        groups[value] = group_df
+    return groups
+
+
 @dataclass
 class JobState:
     """The state of a job for a given input."""
@@ -49,12 +71,16 @@ class JobState:
     pending_jobs_df: InitVar[pd.DataFrame]
 
     def __post_init__(self, pending_jobs_df: pd.DataFrame) -> None:
-        self.valid_pending_jobs_df = (
-            pending_jobs_df.sort_values(["status", "priority", "created_at"], ascending=[False, False, True])
-            .head(1)
-            .copy()
-        )
-        # ^ only keep the first valid job, if any, in order of priority
+        if len(pending_jobs_df) <= 1:
+            # no need to sort (most artifacts have no pending job)
+            self.valid_pending_jobs_df = pending_jobs_df.copy()
+        else:
+            self.valid_pending_jobs_df = (
+                pending_jobs_df.sort_values(["status", "priority", "created_at"], ascending=[False, False, True])
+                .head(1)
+                .copy()
+            )
+            # ^ only keep the first valid job, if any, in order of priority
         self.is_in_process = not self.valid_pending_jobs_df.empty
 
 
@@ -170,6 +196,8 @@ class SplitState:
     cache_entries_df: InitVar[pd.DataFrame]
 
     def __post_init__(self, pending_jobs_df: pd.DataFrame, cache_entries_df: pd.DataFrame) -> None:
+        pending_jobs_df_by_type = group_by_column(pending_jobs_df, "type")
+        cache_entries_df_by_kind = group_by_column(cache_entries_df, "kind")
         self.artifact_state_by_step = {
             processing_step.name: ArtifactState(
                 processing_step=processing_step,
@@ -177,8 +205,8 @@ class SplitState:
                 revision=self.revision,
                 config=self.config,
                 split=self.split,
-                pending_jobs_df=pending_jobs_df[pending_jobs_df["type"] == processing_step.job_type],
-                cache_entries_df=cache_entries_df[cache_entries_df["kind"] == processing_step.cache_kind],
+                pending_jobs_df=pending_jobs_df_by_type[processing_step.job_type],
+                cache_entries_df=cache_entries_df_by_kind[processing_step.cache_kind],
             )
             for processing_step in self.processing_graph.get_input_type_processing_steps(input_type="split")
         }
@@ -199,8 +227,15 @@ class ConfigState:
 
     pending_jobs_df: InitVar[pd.DataFrame]
     cache_entries_df: InitVar[pd.DataFrame]
-
-    def __post_init__(self, pending_jobs_df: pd.DataFrame, cache_entries_df: pd.DataFrame) -> None:
+    # the split names, if they have already been fetched (eg. for all the configs of the dataset at once)
+    fetched_split_names: InitVar[Optional[list[str]]] = None
+
+    def __post_init__(
+        self,
+        pending_jobs_df: pd.DataFrame,
+        cache_entries_df: pd.DataFrame,
+        fetched_split_names: Optional[list[str]] = None,
+    ) -> None:
         with StepProfiler(
             method="ConfigState.__post_init__",
             step="get_config_level_artifact_states",
@@ -224,13 +259,17 @@ class ConfigState:
             method="ConfigState.__post_init__",
             step="get_split_names",
         ):
-            self.split_names = fetch_names(
-                dataset=self.dataset,
-                config=self.config,
-                cache_kind=CONFIG_SPLIT_NAMES_KIND,
-                names_field="splits",
-                name_field="split",
-            )  # Note that we use the cached content even the revision is different (ie. maybe obsolete)
+            self.split_names = (
+                fetch_names(
+                    dataset=self.dataset,
+                    config=self.config,
+                    cache_kind=CONFIG_SPLIT_NAMES_KIND,
+                    names_field="splits",
+                    name_field="split",
+                )  # Note that we use the cached content even the revision is different (ie. maybe obsolete)
+                if fetched_split_names is None
+                else fetched_split_names
+            )
 
         unexpected_split_names = set(cache_entries_df["split"].unique()).difference(
             set(self.split_names).union({None})
@@ -244,6 +283,8 @@ class ConfigState:
             method="ConfigState.__post_init__",
             step="get_split_states",
         ):
+            pending_jobs_df_by_split = group_by_column(pending_jobs_df, "split")
+            cache_entries_df_by_split = group_by_column(cache_entries_df, "split")
             self.split_states = [
                 SplitState(
                     dataset=self.dataset,
@@ -251,8 +292,8 @@ class ConfigState:
                     config=self.config,
                     split=split_name,
                     processing_graph=self.processing_graph,
-                    pending_jobs_df=pending_jobs_df[pending_jobs_df["split"] == split_name],
-                    cache_entries_df=cache_entries_df[cache_entries_df["split"] == split_name],
+                    pending_jobs_df=pending_jobs_df_by_split[split_name],
+                    cache_entries_df=cache_entries_df_by_split[split_name],
                 )
                 for split_name in self.split_names
             ]
@@ -324,16 +365,26 @@ class DatasetState:
                 method="DatasetState.__post_init__",
                 step="get_config_states",
             ):
+                pending_jobs_df_by_config = group_by_column(
+                    pending_jobs_df[pending_jobs_df["revision"] == self.revision], "config"
+                )
+                cache_entries_df_by_config = group_by_column(cache_entries_df, "config")
+                # one query for the split names of all the configs, instead of one per config
+                split_names_by_config = fetch_names_by_config(
+                    dataset=self.dataset,
+                    cache_kind=CONFIG_SPLIT_NAMES_KIND,
+                    names_field="splits",
+                    name_field="split",
+                )  # Note that we use the cached content even the revision is different (ie. maybe obsolete)
                 self.config_states = [
                     ConfigState(
                         dataset=self.dataset,
                         revision=self.revision,
                         config=config_name,
                         processing_graph=self.processing_graph,
-                        pending_jobs_df=pending_jobs_df[
-                            (pending_jobs_df["revision"] == self.revision) & (pending_jobs_df["config"] == config_name)
-                        ],
-                        cache_entries_df=cache_entries_df[cache_entries_df["config"] == config_name],
+                        pending_jobs_df=pending_jobs_df_by_config[config_name],
+                        cache_entries_df=cache_entries_df_by_config[config_name],
+                        fetched_split_names=split_names_by_config.get(config_name, []),
                     )
                     for config_name in self.config_names
                 ]
@@ -1,10 +1,14 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 The HuggingFace Authors.
 
+import errno
 import logging
 import os
 import shutil
-from datetime import datetime, timedelta
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from os import PathLike, makedirs
 from pathlib import Path
 from typing import Optional, Union
@@ -12,6 +16,7 @@ from typing import Optional, Union
 from appdirs import user_cache_dir  # type:ignore
 
 from libcommon.constants import (
+    CLEAN_DIR_MAX_WORKERS,
     DESCRIPTIVE_STATISTICS_CACHE_APPNAME,
     DUCKDB_INDEX_CACHE_APPNAME,
     HF_DATASETS_CACHE_APPNAME,
@@ -122,38 +127,129 @@ def remove_dir(directory: StrPath) -> None:
     logging.debug(f"Directory removed: {directory}")
 
 
-def clean_dir(root_folder: StrPath, expired_time_interval_seconds: int) -> None:
+def _walk_bottom_up(directory: StrPath) -> Iterator[tuple[str, list[os.DirEntry[str]]]]:
+    """Walk a directory tree bottom-up, like `os.walk(directory, topdown=False)`.
+
+    Contrary to `os.walk`, the files are returned as `os.DirEntry` objects, so that their type and their stat
+    result are served from the directory listing instead of requiring new syscalls. As with `os.walk`, the symlinks
+    to directories are not followed, and they are not returned as files either (so they are never deleted by
+    `clean_dir`). The symlinks to files are returned as files.
+
+    Args:
+        directory (`StrPath`): The root directory.
+
+    Yields:
+        `tuple[str, list[os.DirEntry[str]]]`: The path of each directory and the entries of its files, children
+          directories before their parent.
+    """
+    files: list[os.DirEntry[str]] = []
+    subdirectories: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.is_symlink() and entry.is_dir():
+                    # os.walk lists the symlinks to directories as directories, without following them
+                    continue
+                else:
+                    files.append(entry)
+    except OSError:
+        # ignore the directories that cannot be listed (e.g. disappeared), as os.walk does
+        return
+    for subdirectory in subdirectories:
+        yield from _walk_bottom_up(subdirectory)
+    yield os.fspath(directory), files
+
+
+def _remove_expired_file(path: str, last_access_time_value: float) -> bool:
+    """Remove an expired file.
+
+    Args:
+        path (`str`): The path of the file.
+        last_access_time_value (`float`): The last access time of the file, as a timestamp (only used in the logs).
+
+    Returns:
+        `bool`: True if the file has been removed, False if it had already disappeared.
+    """
+    last_access_datetime = datetime.fromtimestamp(last_access_time_value).replace(tzinfo=None)
+    logging.info(f"deleting file {path=} {last_access_datetime=}")
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        logging.error(f"failed to delete {path=} because it has disappeared during the loop")
+        return False
+    return True
+
+
+def clean_dir(
+    root_folder: StrPath, expired_time_interval_seconds: int, max_workers: int = CLEAN_DIR_MAX_WORKERS
+) -> None:
     """
     Delete temporary cache directories under a root folder.
+
+    The expired files are removed in parallel with a thread pool of `max_workers` threads (the deletions are
+    syscall-bound, so they release the GIL), then the empty directories are removed bottom-up.
     """
     logging.info(
         f"looking for all files and directories under {root_folder} to delete files with last accessed time before {expired_time_interval_seconds} seconds ago or is empty folder"
     )
-    now = datetime.now().replace(tzinfo=None)
+    # compare the raw timestamps, to avoid creating datetime objects for every file
+    expiration_timestamp = time.time() - expired_time_interval_seconds
     errors = 0
     total_dirs = 0
     total_files = 0
     total_disappeared_paths = 0
+    # directories that contain a file or a directory that is kept. As the walk is bottom-up, a directory is
+    # always processed after its children, so we don't even try to remove the directories we know are not empty
+    non_empty_dirs: set[str] = set()
+    expired_files: list[str] = []
+    expired_files_last_access_time_values: list[float] = []
+    # directories that should be empty once the expired files are deleted, children before their parent
+    dirs_to_remove: list[str] = []
+
+    for root, files in _walk_bottom_up(root_folder):
+        for entry in files:
+            try:
+                last_access_time_value = entry.stat().st_atime
+            except FileNotFoundError:
+                logging.error(f"failed to delete {entry.path=} because it has disappeared during the loop")
+                total_disappeared_paths += 1
+                continue
+            if last_access_time_value <= expiration_timestamp:
+                expired_files.append(entry.path)
+                expired_files_last_access_time_values.append(last_access_time_value)
+            else:
+                non_empty_dirs.add(root)
+        if root in non_empty_dirs:
+            non_empty_dirs.add(os.path.dirname(root))
+        else:
+            dirs_to_remove.append(root)
+
+    if expired_files:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for removed in executor.map(_remove_expired_file, expired_files, expired_files_last_access_time_values):
+                if removed:
+                    total_files += 1
+                else:
+                    total_disappeared_paths += 1
 
-    for root, _, files in os.walk(root_folder, topdown=False):
+    for root in dirs_to_remove:
+        if root in non_empty_dirs:
+            continue
         try:
-            for name in files:
-                path = os.path.join(root, name)
-                last_access_time_value = os.path.getatime(path)
-                last_access_datetime = datetime.fromtimestamp(last_access_time_value).replace(tzinfo=None)
-                if last_access_datetime + timedelta(seconds=expired_time_interval_seconds) <= now:
-                    logging.info(f"deleting file {path=} {last_access_datetime=}")
-                    os.remove(path)
-                    total_files += 1
-            try:
-                os.rmdir(root)
-                logging.info(f"deleting directory {root=} because it was empty")
-                total_dirs += 1
-            except OSError:
-                pass  # Ignore non-empty directories
+            os.rmdir(root)
+            logging.info(f"deleting directory {root=} because it was empty")
+            total_dirs += 1
         except FileNotFoundError:
-            logging.error(f"failed to delete {path=} because it has disappeared during the loop")
+            logging.error(f"failed to delete {root=} because it has disappeared during the loop")
             total_disappeared_paths += 1
+        except OSError as err:
+            # Ignore non-empty directories (e.g. a file has been created during the loop)
+            if err.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                logging.error(f"failed to delete {root=}: {err}")
+                errors += 1
+            non_empty_dirs.add(os.path.dirname(root))
     if total_files:
         logging.info(f"clean_directory removed {total_files} files at the root of the cache directory.")
     if total_disappeared_paths:
@@ -161,4 +257,7 @@ def clean_dir(root_folder: StrPath, expired_time_interval_seconds: int) -> None:
             f"clean_directory failed to delete {total_disappeared_paths} paths because they disappeared during the loop."
         )
 
-    logging.info(f"clean_directory removed {total_dirs - errors} directories at the root of the cache directory.")
+    if errors:
+        logging.info(f"clean_directory failed to delete {errors} directories.")
+
+    logging.info(f"clean_directory removed {total_dirs} directories at the root of the cache directory.")
@@ -31,6 +31,19 @@ from libcommon.storage_client import StorageClient
 from libcommon.viewer_utils.asset import SUPPORTED_AUDIO_EXTENSIONS, create_audio_file, create_image_file
 
 UNSUPPORTED_FEATURES = [Value("binary")]
+# the cells of these features are returned as is by get_cell_value
+PASSTHROUGH_FEATURE_TYPES = (
+    Value,
+    ClassLabel,
+    Array2D,
+    Array3D,
+    Array4D,
+    Array5D,
+    Translation,
+    TranslationVariableLanguages,
+)
+# the image modes that can be written as JPEG, the other ones (eg. "RGBA" or "P") are written as PNG
+JPEG_COMPATIBLE_IMAGE_MODES = {"1", "L", "RGB", "RGBX", "CMYK", "YCbCr"}
 AUDIO_FILE_MAGIC_NUMBERS: dict[str, Any] = {
     ".wav": [(b"\x52\x49\x46\x46", 0), (b"\x57\x41\x56\x45", 8)],  # AND: (magic_number, start)
     ".mp3": (b"\xff\xfb", b"\xff\xf3", b"\xff\xf2", b"\x49\x44\x33"),  # OR
@@ -84,7 +97,9 @@ def image(
             f"but got {str(value)[:300]}{'...' if len(str(value)) > 300 else ''}"
         )
     # attempt to generate one of the supported formats; if unsuccessful, throw an error
-    for ext, format in [(".jpg", "JPEG"), (".png", "PNG")]:
+    # don't even try JPEG if the image mode is not supported, it would fail after the image has been processed
+    formats = [(".jpg", "JPEG"), (".png", "PNG")] if value.mode in JPEG_COMPATIBLE_IMAGE_MODES else [(".png", "PNG")]
+    for ext, format in formats:
         try:
             return create_image_file(
                 dataset=dataset,
@@ -196,6 +211,26 @@ def infer_audio_file_extension(audio_file_bytes: bytes) -> Optional[str]:
     return None
 
 
+def is_passthrough_feature(feature: FeatureType) -> bool:
+    """Check if the cells of a (possibly nested) feature don't need to be transformed.
+
+    Args:
+        feature (`FeatureType`): the feature type to be checked.
+
+    Returns:
+        `bool`: True if the feature does not contain any Image or Audio (or unknown) feature.
+    """
+    passthrough = True
+
+    def check(feature: FeatureType) -> None:
+        nonlocal passthrough
+        if not isinstance(feature, (dict, list, Sequence, *PASSTHROUGH_FEATURE_TYPES)):
+            passthrough = False
+
+    _visit(feature, check)
+    return passthrough
+
+
 def get_cell_value(
     dataset: str,
     revision: str,
@@ -211,6 +246,9 @@ def get_cell_value(
     # always allow None values in the cells
     if cell is None:
         return cell
+    # the most common case first: plain values are returned as is
+    if isinstance(fieldType, PASSTHROUGH_FEATURE_TYPES):
+        return cell
     if isinstance(fieldType, Image):
         return image(
             dataset=dataset,
@@ -241,6 +279,9 @@ def get_cell_value(
         if len(fieldType) != 1:
             raise TypeError("the feature type should be a 1-element list.")
         subFieldType = fieldType[0]
+        if isinstance(subFieldType, PASSTHROUGH_FEATURE_TYPES):
+            # no need to visit every item
+            return cell
         return [
             get_cell_value(
                 dataset=dataset,
@@ -260,6 +301,9 @@ def get_cell_value(
         if isinstance(cell, list):
             if fieldType.length >= 0 and len(cell) != fieldType.length:
                 raise TypeError("the cell length should be the same as the Sequence length.")
+            if isinstance(fieldType.feature, PASSTHROUGH_FEATURE_TYPES):
+                # no need to visit every item
+                return cell
             return [
                 get_cell_value(
                     dataset=dataset,
@@ -282,7 +326,9 @@ def get_cell_value(
             if any(not isinstance(v, list) or (k not in fieldType.feature) for k, v in cell.items()):
                 raise TypeError("The value of a Sequence of dicts should be a dictionary of lists.")
             return {
-                key: [
+                key: subCell
+                if isinstance(fieldType.feature[key], PASSTHROUGH_FEATURE_TYPES)
+                else [
                     get_cell_value(
                         dataset=dataset,
                         revision=revision,
@@ -305,7 +351,9 @@ def get_cell_value(
         if not isinstance(cell, dict):
             raise TypeError("dict cell must be a dict.")
         return {
-            key: get_cell_value(
+            key: subCell
+            if isinstance(fieldType[key], PASSTHROUGH_FEATURE_TYPES)
+            else get_cell_value(
                 dataset=dataset,
                 revision=revision,
                 config=config,
@@ -319,20 +367,6 @@ def get_cell_value(
             )
             for (key, subCell) in cell.items()
         }
-    elif isinstance(
-        fieldType,
-        (
-            Value,
-            ClassLabel,
-            Array2D,
-            Array3D,
-            Array4D,
-            Array5D,
-            Translation,
-            TranslationVariableLanguages,
-        ),
-    ):
-        return cell
     else:
         raise TypeError("could not determine the type of the data cell.")
 
@@ -345,14 +379,13 @@ def get_cell_value(
 # > The terms "object" and "array" come from the conventions of JavaScript.
 # from https://stackoverflow.com/a/7214312/7351594 / https://www.rfc-editor.org/rfc/rfc7159.html
 def to_features_list(features: Features) -> list[FeatureItem]:
-    features_dict = features.to_dict()
     return [
         {
             "feature_idx": idx,
             "name": name,
-            "type": features_dict[name],
+            "type": feature_type,
         }
-        for idx, name in enumerate(features)
+        for idx, (name, feature_type) in enumerate(features.to_dict().items())
     ]
 
 
@@ -2,9 +2,11 @@
 # Copyright 2022 The HuggingFace Authors.
 
 
-from typing import Protocol
+from typing import Any, Protocol
 
 from datasets import Audio, Features, Image, Value
+from datasets.features.features import FeatureType
+from tqdm.contrib.concurrent import thread_map
 
 from libcommon.dtos import Row, RowsContent, SplitFirstRowsResponse
 from libcommon.exceptions import (
@@ -14,7 +16,7 @@ from libcommon.exceptions import (
 )
 from libcommon.storage_client import StorageClient
 from libcommon.utils import get_json_size
-from libcommon.viewer_utils.features import get_cell_value, to_features_list
+from libcommon.viewer_utils.features import get_cell_value, is_passthrough_feature, to_features_list
 from libcommon.viewer_utils.truncate_rows import create_truncated_row_items
 
 URL_COLUMN_RATIO = 0.3
@@ -29,23 +31,39 @@ def transform_rows(
     features: Features,
     storage_client: StorageClient,
 ) -> list[Row]:
-    return [
-        {
-            featureName: get_cell_value(
-                dataset=dataset,
-                revision=revision,
-                config=config,
-                split=split,
-                row_idx=row_idx,
-                cell=row[featureName] if featureName in row else None,
-                featureName=featureName,
-                fieldType=fieldType,
-                storage_client=storage_client,
-            )
-            for (featureName, fieldType) in features.items()
-        }
-        for row_idx, row in enumerate(rows)
+    # the features are inspected once: the cells of the columns without Image or Audio are returned as is
+    passthrough_columns = {
+        featureName for (featureName, fieldType) in features.items() if is_passthrough_feature(fieldType)
+    }
+    transformed_rows: list[Row] = [{featureName: row.get(featureName) for featureName in features} for row in rows]
+    tasks = [
+        (row_idx, featureName, fieldType)
+        for row_idx in range(len(rows))
+        for (featureName, fieldType) in features.items()
+        if featureName not in passthrough_columns
     ]
+    if not tasks:
+        return transformed_rows
+
+    def transform_cell(task: tuple[int, str, FeatureType]) -> Any:
+        row_idx, featureName, fieldType = task
+        return get_cell_value(
+            dataset=dataset,
+            revision=revision,
+            config=config,
+            split=split,
+            row_idx=row_idx,
+            cell=transformed_rows[row_idx][featureName],
+            featureName=featureName,
+            fieldType=fieldType,
+            storage_client=storage_client,
+        )
+
+    # the cells are independent: create the image and audio assets in parallel, as for the /rows responses
+    transformed_cells = thread_map(transform_cell, tasks, desc=f"transform_cell for {dataset}", total=len(tasks))
+    for (row_idx, featureName, _), transformed_cell in zip(tasks, transformed_cells):
+        transformed_rows[row_idx][featureName] = transformed_cell
+    return transformed_rows
 
 
 class GetRowsContent(Protocol):
@@ -9,7 +9,7 @@ import pytest
 import pytz
 
 from libcommon.constants import QUEUE_TTL_SECONDS
-from libcommon.dtos import Priority, Status, WorkerSize
+from libcommon.dtos import JobInfo, Priority, Status, WorkerSize
 from libcommon.queue.dataset_blockages import block_dataset
 from libcommon.queue.jobs import EmptyQueueError, JobDocument, Queue
 from libcommon.queue.metrics import JobTotalMetricDocument, WorkerSizeJobsCountDocument
@@ -424,6 +424,36 @@ def test_get_jobs_count_by_worker_size() -> None:
     assert queue.get_jobs_count_by_worker_size() == {"heavy": 0, "medium": 0, "light": 0}
 
 
+def test_create_jobs_metrics() -> None:
+    test_type = "test_type"
+    test_other_type = "test_other_type"
+    test_dataset = "test_dataset"
+    test_blocked_dataset = "blocked_dataset"
+    test_revision = "test_revision"
+    block_dataset(test_blocked_dataset)
+    job_infos: list[JobInfo] = [
+        {
+            "job_id": "not used",
+            "type": job_type,
+            "params": {"dataset": dataset, "revision": test_revision, "config": None, "split": split},
+            "priority": Priority.NORMAL,
+            "difficulty": difficulty,
+        }
+        for job_type, dataset, split, difficulty in [
+            (test_type, test_dataset, "split1", 50),
+            (test_type, test_dataset, "split2", 50),
+            (test_other_type, test_dataset, "split1", 10),
+            (test_type, test_blocked_dataset, "split1", 90),
+        ]
+    ]
+    assert Queue().create_jobs(job_infos=job_infos) == 4
+    assert_metric_jobs_per_type(job_type=test_type, status=Status.WAITING, total=3)
+    assert_metric_jobs_per_type(job_type=test_other_type, status=Status.WAITING, total=1)
+    assert_metric_jobs_per_worker(worker_size=WorkerSize.medium, jobs_count=2)
+    assert_metric_jobs_per_worker(worker_size=WorkerSize.light, jobs_count=1)
+    assert WorkerSizeJobsCountDocument.objects(worker_size=WorkerSize.heavy).first() is None
+
+
 def test_get_dataset_pending_jobs_for_type() -> None:
     queue = Queue()
     test_type = "test_type"
@@ -6,12 +6,13 @@ import shutil
 from collections.abc import Generator
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 from unittest.mock import patch
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
-from datasets import Dataset, Image, concatenate_datasets
+from datasets import Dataset, Features, Image, Value, concatenate_datasets
 from datasets.table import embed_table_storage
 from fsspec import AbstractFileSystem
 from fsspec.implementations.http import HTTPFileSystem
@@ -19,6 +20,7 @@ from fsspec.implementations.http import HTTPFileSystem
 from libcommon.parquet_utils import (
     Indexer,
     ParquetIndexWithMetadata,
+    RowGroupReader,
     RowsIndex,
     SchemaMismatchError,
     TooBigRows,
@@ -31,6 +33,7 @@ from libcommon.simple_cache import upsert_response
 from libcommon.storage import StrPath
 
 REVISION_NAME = "revision"
+ROW_GROUP_SIZE = 30
 CACHED_ASSETS_FOLDER = "cached-assets"
 
 pytestmark = pytest.mark.anyio
@@ -346,6 +349,60 @@ def dataset_image_with_config_parquet() -> dict[str, Any]:
     return config_parquet_content
 
 
+@pytest.fixture
+def ds_row_groups() -> Dataset:
+    num_rows = 70
+    return Dataset.from_dict(
+        {"text": [f"row {i}" for i in range(num_rows)], "binary": [f"binary {i}".encode() for i in range(num_rows)]},
+        features=Features({"text": Value("string"), "binary": Value("binary")}),
+    )
+
+
+@pytest.fixture
+def ds_row_groups_fs(ds_row_groups: Dataset, tmpfs: AbstractFileSystem) -> Generator[AbstractFileSystem, None, None]:
+    # 3 row groups: 30 + 30 + 10 rows
+    with tmpfs.open("default/train/0000.parquet", "wb") as f:
+        pq.write_table(ds_row_groups.data.table, f, row_group_size=ROW_GROUP_SIZE)
+    yield tmpfs
+
+
+@pytest.fixture
+def dataset_row_groups_with_config_parquet_metadata(
+    ds_row_groups_fs: AbstractFileSystem, parquet_metadata_directory: StrPath
+) -> Generator[dict[str, Any], None, None]:
+    parquet_file_path = "default/train/0000.parquet"
+    parquet_file_metadata_path = Path(parquet_metadata_directory) / "ds_row_groups" / "--" / parquet_file_path
+    parquet_file_metadata_path.parent.mkdir(parents=True, exist_ok=True)
+    with ds_row_groups_fs.open(parquet_file_path) as parquet_f:
+        with open(parquet_file_metadata_path, "wb") as parquet_file_metadata_f:
+            pq.read_metadata(parquet_f).write_metadata_file(parquet_file_metadata_f)
+    config_parquet_metadata_content = {
+        "parquet_files_metadata": [
+            {
+                "dataset": "ds_row_groups",
+                "config": "default",
+                "split": "train",
+                "url": f"https://fake.huggingface.co/datasets/ds_row_groups/resolve/refs%2Fconvert%2Fparquet/{parquet_file_path}",  # noqa: E501
+                "filename": os.path.basename(parquet_file_path),
+                "size": ds_row_groups_fs.info(parquet_file_path)["size"],
+                "num_rows": pq.read_metadata(ds_row_groups_fs.open(parquet_file_path)).num_rows,
+                "parquet_metadata_subpath": f"ds_row_groups/--/{parquet_file_path}",
+            }
+        ]
+    }
+    upsert_response(
+        kind="config-parquet-metadata",
+        dataset="ds_row_groups",
+        dataset_git_revision=REVISION_NAME,
+        config="default",
+        content=config_parquet_metadata_content,
+        http_status=HTTPStatus.OK,
+        progress=1.0,
+    )
+    yield config_parquet_metadata_content
+    shutil.rmtree(Path(parquet_metadata_directory) / "ds_row_groups")
+
+
 @pytest.fixture
 def rows_index_with_parquet_metadata(
     indexer: Indexer,
@@ -491,6 +548,58 @@ def test_indexer_schema_mistmatch_error(
                     index.query(offset=0, length=3)
 
 
+@pytest.mark.parametrize("num_rows", [None, 1, 29, 30, 31])
+def test_row_group_reader_read(
+    ds_row_groups: Dataset, ds_row_groups_fs: AbstractFileSystem, num_rows: Optional[int]
+) -> None:
+    with ds_row_groups_fs.open("default/train/0000.parquet") as f:
+        parquet_file = pq.ParquetFile(f)
+        for group_id in range(parquet_file.metadata.num_row_groups):
+            row_group = parquet_file.read_row_group(group_id)
+            pa_table = RowGroupReader(
+                parquet_file=parquet_file, group_id=group_id, features=ds_row_groups.features
+            ).read(columns=["text", "binary"], num_rows=num_rows)
+            assert pa_table.equals(row_group.slice(0, num_rows))
+
+
+@pytest.mark.parametrize(
+    "offset,length",
+    [
+        (0, 5),  # ends in the middle of the first row group
+        (3, 20),  # starts and ends in the middle of the first row group
+        (25, 10),  # spans two row groups, ends in the middle of the second one
+        (30, 30),  # exactly the second row group
+        (55, 100),  # ends after the last row
+    ],
+)
+def test_rows_index_query_with_row_groups(
+    indexer: Indexer,
+    ds_row_groups_fs: AbstractFileSystem,
+    dataset_row_groups_with_config_parquet_metadata: dict[str, Any],
+    offset: int,
+    length: int,
+) -> None:
+    with ds_row_groups_fs.open("default/train/0000.parquet") as f:
+        parquet_file = pq.ParquetFile(f)
+        assert [
+            parquet_file.metadata.row_group(group_id).num_rows
+            for group_id in range(parquet_file.metadata.num_row_groups)
+        ] == [ROW_GROUP_SIZE, ROW_GROUP_SIZE, 10]
+        row_groups = pa.concat_tables(
+            [parquet_file.read_row_group(group_id) for group_id in range(parquet_file.metadata.num_row_groups)]
+        )
+        expected = row_groups.slice(offset, length)
+        with patch("libcommon.parquet_utils.HTTPFile", return_value=f):
+            index = indexer.get_rows_index("ds_row_groups", "default", "train")
+            # the binary column makes query_truncated_binary read the row groups itself
+            assert index.parquet_index.features["binary"] == Value("binary")
+            pa_table = index.query(offset=offset, length=length)
+            truncated_pa_table, truncated_columns = index.query_truncated_binary(offset=offset, length=length)
+    assert pa_table.equals(expected)
+    assert truncated_pa_table.equals(expected)
+    assert truncated_columns == []
+
+
 @pytest.mark.parametrize(
     "parquet_url,expected",
     [
@@ -3,7 +3,13 @@
 
 import pytest
 
-from libcommon.processing_graph import ProcessingGraph, ProcessingGraphSpecification, ProcessingStep, processing_graph
+from libcommon.processing_graph import (
+    ProcessingGraph,
+    ProcessingGraphSpecification,
+    ProcessingStep,
+    ProcessingStepDoesNotExist,
+    processing_graph,
+)
 
 
 def assert_lists_are_equal(a: list[ProcessingStep], b: list[str]) -> None:
@@ -433,3 +439,9 @@ def test_default_graph_steps(
 def test_default_graph_first_steps() -> None:
     roots = ["dataset-config-names", "dataset-filetypes"]
     assert_lists_are_equal(processing_graph.get_first_processing_steps(), roots)
+
+
+@pytest.mark.parametrize("method", ["get_children", "get_parents", "get_ancestors"])
+def test_default_graph_unknown_step(method: str) -> None:
+    with pytest.raises(ProcessingStepDoesNotExist):
+        getattr(processing_graph, method)("unknown-step")
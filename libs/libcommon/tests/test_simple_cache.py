@@ -24,6 +24,7 @@ from libcommon.simple_cache import (
     delete_dataset_responses,
     delete_response,
     fetch_names,
+    fetch_names_by_config,
     get_cache_reports,
     get_cache_reports_with_content,
     get_dataset_responses_without_content_for_kind,
@@ -835,6 +836,32 @@ def test_fetch_names(
     )
 
 
+def test_fetch_names_by_config() -> None:
+    cache_kind = CACHE_KIND_A
+    for config, response_spec in [(CONFIG_NAME_1, NAMES_RESPONSE_OK), (CONFIG_NAME_2, RESPONSE_ERROR)]:
+        upsert_response(
+            kind=cache_kind,
+            dataset=DATASET_NAME,
+            dataset_git_revision=REVISION_NAME,
+            config=config,
+            split=None,
+            content=response_spec["content"],
+            http_status=response_spec["http_status"],
+        )
+    upsert_response(
+        kind=CACHE_KIND_B,
+        dataset=DATASET_NAME,
+        dataset_git_revision=REVISION_NAME,
+        config=CONFIG_NAME_2,
+        split=None,
+        content=NAMES_RESPONSE_OK["content"],
+        http_status=NAMES_RESPONSE_OK["http_status"],
+    )
+    assert fetch_names_by_config(
+        dataset=DATASET_NAME, cache_kind=cache_kind, names_field=NAMES_FIELD, name_field=NAME_FIELD
+    ) == {CONFIG_NAME_1: NAMES}
+
+
 class Entry(TypedDict):
     kind: str
     dataset: str
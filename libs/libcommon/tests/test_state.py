@@ -4,6 +4,7 @@
 from http import HTTPStatus
 from typing import Optional
 
+import pandas as pd
 import pytest
 
 from libcommon.queue.jobs import Queue
@@ -19,6 +20,7 @@ from libcommon.state import (
     ConfigState,
     DatasetState,
     SplitState,
+    group_by_column,
 )
 
 from .utils import (
@@ -76,6 +78,16 @@ def test_get_cache_entries_df() -> None:
     assert entries.shape[0] == expected_entries
 
 
+def test_group_by_column() -> None:
+    df = pd.DataFrame({"split": ["train", None, "test", "train"], "kind": ["a", "b", "c", "d"]})
+    groups = group_by_column(df, "split")
+    assert groups["train"]["kind"].tolist() == ["a", "d"]
+    assert groups["test"]["kind"].tolist() == ["c"]
+    assert groups["validation"].empty
+    assert groups["validation"].columns.tolist() == ["split", "kind"]
+    assert None not in groups
+
+
 @pytest.mark.parametrize(
     "dataset,config,split,cache_kind",
     [
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2022 The HuggingFace Authors.
 
+import os
 import time
 from pathlib import Path
 from typing import Optional
@@ -101,3 +102,52 @@ def test_clean_directory(tmp_path_factory: TempPathFactory) -> None:
     clean_dir(root_folder, expired_time_interval_seconds)
     assert not cache_file.is_file()
     assert not test_dataset_cache.is_dir()  # it should be deleted because is empty
+
+
+def test_clean_directory_keeps_parents_of_recent_files(tmp_path_factory: TempPathFactory) -> None:
+    root_folder = tmp_path_factory.mktemp("test_clean_directory") / "root_folder"
+    expired_time_interval_seconds = 60
+    expired_timestamp = time.time() - 2 * expired_time_interval_seconds
+
+    expired_dir = root_folder / "medium/datasets/expired"
+    expired_dir.mkdir(parents=True, exist_ok=True)
+    expired_file = expired_dir / "foo.txt"
+    expired_file.touch()
+    os.utime(expired_file, (expired_timestamp, expired_timestamp))
+    recent_dir = root_folder / "medium/datasets/recent/nested"
+    recent_dir.mkdir(parents=True, exist_ok=True)
+    recent_file = recent_dir / "bar.txt"
+    recent_file.touch()
+    empty_dir = root_folder / "other/empty"
+    empty_dir.mkdir(parents=True, exist_ok=True)
+
+    clean_dir(root_folder, expired_time_interval_seconds)
+
+    assert not expired_dir.exists()
+    assert not (root_folder / "other").exists()
+    assert recent_file.is_file()
+    assert (root_folder / "medium/datasets").is_dir()
+
+
+def test_clean_directory_keeps_symlinks_to_directories(tmp_path_factory: TempPathFactory) -> None:
+    root_folder = tmp_path_factory.mktemp("test_clean_directory") / "root_folder"
+    expired_time_interval_seconds = 60
+    expired_timestamp = time.time() - 2 * expired_time_interval_seconds
+
+    target_dir = tmp_path_factory.mktemp("test_clean_directory") / "target"
+    target_dir.mkdir()
+    target_file = target_dir / "foo.txt"
+    target_file.touch()
+    os.utime(target_dir, (expired_timestamp, expired_timestamp))
+    os.utime(target_file, (expired_timestamp, expired_timestamp))
+    link_dir = root_folder / "medium/datasets"
+    link_dir.mkdir(parents=True, exist_ok=True)
+    link = link_dir / "link"
+    link.symlink_to(target_dir, target_is_directory=True)
+
+    clean_dir(root_folder, expired_time_interval_seconds)
+
+    # the symlink is not followed nor deleted, and its parent directory is not empty
+    assert link.is_symlink()
+    assert target_file.is_file()
+    assert link_dir.is_dir()
@@ -10,8 +10,10 @@ from unittest.mock import patch
 import boto3
 import pytest
 from aiobotocore.response import StreamingBody
-from datasets import Audio, Features, Image, Value
+from datasets import Audio, ClassLabel, Features, Image, Sequence, Value
+from datasets.features.features import FeatureType
 from moto import mock_s3
+from PIL import Image as PILImage
 from urllib3._collections import HTTPHeaderDict  # type: ignore
 
 from libcommon.config import S3Config
@@ -20,6 +22,7 @@ from libcommon.viewer_utils.features import (
     get_cell_value,
     get_supported_unsupported_columns,
     infer_audio_file_extension,
+    is_passthrough_feature,
     to_features_list,
 )
 
@@ -85,6 +88,23 @@ def test_get_cell_value_value(
 to_features_list
 
 
+@pytest.mark.parametrize("mode,expected_extension", [("RGB", ".jpg"), ("L", ".jpg"), ("RGBA", ".png"), ("P", ".png")])
+def test_get_cell_value_image_format(storage_client: StorageClient, mode: str, expected_extension: str) -> None:
+    value = get_cell_value(
+        dataset="dataset",
+        revision=DEFAULT_REVISION,
+        config=DEFAULT_CONFIG,
+        split=DEFAULT_SPLIT,
+        row_idx=DEFAULT_ROW_IDX,
+        cell=PILImage.new(mode, (4, 4)),
+        featureName=DEFAULT_COLUMN_NAME,
+        fieldType=Image(),
+        storage_client=storage_client,
+    )
+    assert value["src"].endswith(f"/image{expected_extension}")
+    assert_output_has_valid_files(value, storage_client=storage_client)
+
+
 @pytest.mark.parametrize("dataset_name", DATASETS_NAMES)
 def test_to_features_list(
     datasets_fixtures: Mapping[str, DatasetFixture],
@@ -119,6 +139,24 @@ def test_get_supported_unsupported_columns() -> None:
     assert unsupported_columns == ["audio1", "audio2", "audio3", "binary"]
 
 
+@pytest.mark.parametrize(
+    "feature,expected",
+    [
+        (Value("string"), True),
+        (ClassLabel(names=["a", "b"]), True),
+        (Sequence(Value("int64")), True),
+        ([{"a": Value("int64"), "b": [Value("string")]}], True),
+        (Image(), False),
+        (Audio(), False),
+        (Sequence(Image()), False),
+        ({"a": Value("int64"), "b": Audio()}, False),
+        ([{"a": [Image()]}], False),
+    ],
+)
+def test_is_passthrough_feature(feature: FeatureType, expected: bool) -> None:
+    assert is_passthrough_feature(feature) is expected
+
+
 # specific test created for https://github.com/huggingface/dataset-viewer/issues/2045
 # which is reproduced only when using s3 for fsspec
 def test_ogg_audio_with_s3(
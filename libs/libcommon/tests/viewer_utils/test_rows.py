@@ -58,6 +58,17 @@ def test_create_first_rows_response(
 
 
 NUM_ROWS = 15
+CELL_SIZE = 1_234
+
+
+@pytest.fixture(scope="module")
+def truncation_dataset() -> Dataset:
+    return Dataset.from_pandas(
+        pd.DataFrame(
+            ["a" * CELL_SIZE for _ in range(NUM_ROWS)],
+            dtype=pd.StringDtype(storage="python"),
+        )
+    )
 
 
 @pytest.mark.parametrize(
@@ -70,17 +81,12 @@ NUM_ROWS = 15
 )
 def test_create_first_rows_response_truncated(
     storage_client: StorageClient,
+    truncation_dataset: Dataset,
     rows_max_bytes: int,
     rows_max_number: int,
     truncated: bool,
 ) -> None:
-    CELL_SIZE = 1_234
-    dataset = Dataset.from_pandas(
-        pd.DataFrame(
-            ["a" * CELL_SIZE for _ in range(NUM_ROWS)],
-            dtype=pd.StringDtype(storage="python"),
-        )
-    )
+    dataset = truncation_dataset
 
     response = create_first_rows_response(
         dataset="dataset",
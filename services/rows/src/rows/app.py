@@ -4,6 +4,7 @@
 import uvicorn
 from libapi.config import UvicornConfig
 from libapi.jwt_token import get_jwt_public_keys
+from libapi.response_cache import ResponseCache
 from libapi.routes.healthcheck import healthcheck_endpoint
 from libapi.routes.metrics import create_metrics_endpoint
 from libapi.utils import EXPOSED_HEADERS
@@ -101,6 +102,10 @@ def create_app_with_config(app_config: AppConfig) -> Starlette:
                 max_age_long=app_config.api.max_age_long,
                 max_age_short=app_config.api.max_age_short,
                 storage_clients=storage_clients,
+                response_cache=ResponseCache(
+                    max_bytes=app_config.api.response_cache_max_bytes,
+                    ttl_seconds=app_config.api.response_cache_ttl_seconds,
+                ),
             ),
         ),
     ]
@@ -2,7 +2,7 @@
 # Copyright 2022 The HuggingFace Authors.
 
 import logging
-from typing import Literal, Optional, Union
+from typing import Any, Literal, Optional, Union
 
 from fsspec.implementations.http import HTTPFileSystem
 from libapi.authentication import auth_check
@@ -13,11 +13,12 @@ from libapi.request import (
     get_request_parameter_offset,
 )
 from libapi.response import create_response
+from libapi.response_cache import ResponseCache
 from libapi.utils import (
     Endpoint,
     get_json_api_error_response,
     get_json_error_response,
-    get_json_ok_response,
+    get_serialized_json_ok_response,
     try_backfill_dataset_then_raise,
 )
 from libcommon.constants import CONFIG_PARQUET_METADATA_KIND
@@ -26,6 +27,7 @@ from libcommon.prometheus import StepProfiler
 from libcommon.simple_cache import CachedArtifactError, CachedArtifactNotFoundError
 from libcommon.storage import StrPath
 from libcommon.storage_client import StorageClient
+from libcommon.utils import orjson_dumps
 from libcommon.viewer_utils.features import UNSUPPORTED_FEATURES
 from starlette.requests import Request
 from starlette.responses import Response
@@ -50,6 +52,7 @@ def create_rows_endpoint(
     max_age_long: int = 0,
     max_age_short: int = 0,
     storage_clients: Optional[list[StorageClient]] = None,
+    response_cache: Optional[ResponseCache] = None,
 ) -> Endpoint:
     indexer = Indexer(
         hf_token=hf_token,
@@ -63,6 +66,7 @@ def create_rows_endpoint(
     async def rows_endpoint(request: Request) -> Response:
         await indexer.httpfs.set_session()
         revision: Optional[str] = None
+        response_cache_key: Optional[tuple[Any, ...]] = None
         with StepProfiler(method="rows_endpoint", step="all"):
             try:
                 with StepProfiler(method="rows_endpoint", step="validate parameters"):
@@ -72,6 +76,7 @@ def create_rows_endpoint(
                     offset = get_request_parameter_offset(request)
                     length = get_request_parameter_length(request)
                     logging.info(f"/rows, {dataset=}, {config=}, {split=}, {offset=}, {length=}")
+                    response_cache_key = (dataset, config, split, offset, length)
                 with StepProfiler(method="rows_endpoint", step="check authentication"):
                     # if auth_check fails, it will raise an exception that will be caught below
                     await auth_check(
@@ -90,6 +95,14 @@ def create_rows_endpoint(
                             split=split,
                         )
                         revision = rows_index.revision
+                    with StepProfiler(method="rows_endpoint", step="get the response from the cache"):
+                        cached_response = (
+                            response_cache.get(response_cache_key, revision=revision) if response_cache else None
+                        )
+                    if cached_response is not None:
+                        return get_serialized_json_ok_response(
+                            cached_response, max_age=max_age_long, revision=revision
+                        )
                     with StepProfiler(method="rows_endpoint", step="query the rows"):
                         try:
                             truncated_columns: list[str] = []
@@ -116,6 +129,10 @@ def create_rows_endpoint(
                             num_rows_total=rows_index.parquet_index.num_rows_total,
                             truncated_columns=truncated_columns,
                         )
+                    with StepProfiler(method="rows_endpoint", step="serialize the response"):
+                        serialized_response = orjson_dumps(response)
+                    if response_cache:
+                        response_cache.set(response_cache_key, revision=revision, content=serialized_response)
                 except CachedArtifactNotFoundError:
                     with StepProfiler(method="rows_endpoint", step="try backfill dataset"):
                         try_backfill_dataset_then_raise(
@@ -128,7 +145,9 @@ def create_rows_endpoint(
                             storage_clients=storage_clients,
                         )
                 with StepProfiler(method="rows_endpoint", step="generate the OK response"):
-                    return get_json_ok_response(content=response, max_age=max_age_long, revision=revision)
+                    return get_serialized_json_ok_response(
+                        serialized_response, max_age=max_age_long, revision=revision
+                    )
             except CachedArtifactError as e:
                 content = e.cache_entry_with_details["content"]
                 http_status = e.cache_entry_with_details["http_status"]
@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 The HuggingFace Authors.
+
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import pyarrow.parquet as pq
+import pytest
+from datasets import Dataset
+from libapi.response import create_response
+from libapi.response_cache import ResponseCache
+from libcommon.constants import CONFIG_PARQUET_METADATA_KIND
+from libcommon.parquet_utils import Indexer
+from libcommon.simple_cache import upsert_response
+from libcommon.storage_client import StorageClient
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from rows.config import AppConfig
+from rows.routes.rows import create_rows_endpoint
+
+DATASET = "ds"
+CONFIG = "default"
+SPLIT = "train"
+PARQUET_FILE_PATH = f"{CONFIG}/{SPLIT}/0000.parquet"
+PARQUET_METADATA_SUBPATH = f"{DATASET}/--/{PARQUET_FILE_PATH}"
+
+
+@pytest.fixture
+def ds() -> Dataset:
+    return Dataset.from_dict({"text": ["Hello there", "General Kenobi"]})
+
+
+@pytest.fixture
+def parquet_file_path(ds: Dataset, tmp_path: Path) -> Path:
+    parquet_file_path = tmp_path / "parquet" / PARQUET_FILE_PATH
+    parquet_file_path.parent.mkdir(parents=True)
+    ds.to_parquet(parquet_file_path)
+    return parquet_file_path
+
+
+@pytest.fixture
+def parquet_metadata_directory(parquet_file_path: Path, tmp_path: Path) -> Path:
+    parquet_metadata_directory = tmp_path / "parquet-metadata"
+    parquet_metadata_path = parquet_metadata_directory / PARQUET_METADATA_SUBPATH
+    parquet_metadata_path.parent.mkdir(parents=True)
+    pq.read_metadata(parquet_file_path).write_metadata_file(parquet_metadata_path)
+    return parquet_metadata_directory
+
+
+@pytest.fixture
+def remote_parquet_file(monkeypatch: pytest.MonkeyPatch, parquet_file_path: Path) -> None:
+    # serve the local parquet file instead of downloading it
+    def open_parquet_file(*args: Any, **kwargs: Any) -> BinaryIO:
+        return parquet_file_path.open("rb")
+
+    monkeypatch.setattr("libcommon.parquet_utils.HTTPFile", open_parquet_file)
+
+
+@pytest.fixture
+def created_responses(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    # record the responses that are actually computed
+    created_responses: list[int] = []
+
+    async def record_and_create_response(**kwargs: Any) -> Any:
+        created_responses.append(kwargs["offset"])
+        return await create_response(**kwargs)
+
+    monkeypatch.setattr("rows.routes.rows.create_response", record_and_create_response)
+    return created_responses
+
+
+def upsert_parquet_metadata_cache_entry(parquet_file_path: Path, revision: str) -> None:
+    upsert_response(
+        kind=CONFIG_PARQUET_METADATA_KIND,
+        dataset=DATASET,
+        config=CONFIG,
+        dataset_git_revision=revision,
+        content={
+            "parquet_files_metadata": [
+                {
+                    "dataset": DATASET,
+                    "config": CONFIG,
+                    "split": SPLIT,
+                    "url": f"https://fake.huggingface.co/datasets/{DATASET}/resolve/refs%2Fconvert%2Fparquet/{PARQUET_FILE_PATH}",  # noqa: E501
+                    "filename": "0000.parquet",
+                    "size": parquet_file_path.stat().st_size,
+                    "num_rows": pq.read_metadata(parquet_file_path).num_rows,
+                    "parquet_metadata_subpath": PARQUET_METADATA_SUBPATH,
+                }
+            ]
+        },
+        http_status=HTTPStatus.OK,
+        progress=1.0,
+    )
+
+
+def test_rows_endpoint_response_cache(
+    app_config: AppConfig,
+    tmp_path: Path,
+    parquet_file_path: Path,
+    parquet_metadata_directory: Path,
+    remote_parquet_file: None,
+    created_responses: list[int],
+) -> None:
+    client = TestClient(
+        Starlette(
+            routes=[
+                Route(
+                    "/rows",
+                    endpoint=create_rows_endpoint(
+                        cached_assets_storage_client=StorageClient(
+                            protocol="file",
+                            storage_root=str(tmp_path / "cached-assets"),
+                            base_url=app_config.cached_assets.base_url,
+                        ),
+                        parquet_metadata_directory=parquet_metadata_directory,
+                        max_arrow_data_in_memory=app_config.rows_index.max_arrow_data_in_memory,
+                        hf_endpoint=app_config.common.hf_endpoint,
+                        blocked_datasets=[],
+                        response_cache=ResponseCache(max_bytes=1_000_000, ttl_seconds=60),
+                    ),
+                )
+            ]
+        )
+    )
+    params = {"dataset": DATASET, "config": CONFIG, "split": SPLIT, "offset": "0", "length": "2"}
+    upsert_parquet_metadata_cache_entry(parquet_file_path, revision="revision-1")
+    response = client.get("/rows", params=params)
+    assert response.status_code == 200
+    assert [row["row"] for row in response.json()["rows"]] == [{"text": "Hello there"}, {"text": "General Kenobi"}]
+    assert len(created_responses) == 1
+    # the same request is served from the cache
+    cached_response = client.get("/rows", params=params)
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+    assert cached_response.headers["X-Revision"] == "revision-1"
+    assert len(created_responses) == 1
+    # a new revision of the dataset is a cache miss
+    upsert_parquet_metadata_cache_entry(parquet_file_path, revision="revision-2")
+    # the rows index of the last requested split is kept in memory, forget it to read the new revision
+    Indexer.get_rows_index.cache_clear()
+    new_response = client.get("/rows", params=params)
+    assert new_response.status_code == 200
+    assert new_response.headers["X-Revision"] == "revision-2"
+    assert len(created_responses) == 2
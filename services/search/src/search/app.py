@@ -4,6 +4,7 @@
 import uvicorn
 from libapi.config import UvicornConfig
 from libapi.jwt_token import get_jwt_public_keys
+from libapi.response_cache import ResponseCache
 from libapi.routes.healthcheck import healthcheck_endpoint
 from libapi.routes.metrics import create_metrics_endpoint
 from libapi.utils import EXPOSED_HEADERS
@@ -60,6 +61,10 @@ def create_app_with_config(app_config: AppConfig) -> Starlette:
     cache_resource = CacheMongoResource(database=app_config.cache.mongo_database, host=app_config.cache.mongo_url)
     queue_resource = QueueMongoResource(database=app_config.queue.mongo_database, host=app_config.queue.mongo_url)
     url_signer = get_cloudfront_signer(cloudfront_config=app_config.cloudfront)
+    # the stale responses contain signed URLs: they must not be served once the URLs have expired
+    response_cache_max_stale_seconds = min(
+        app_config.api.response_cache_max_stale_seconds, app_config.cloudfront.expiration_seconds // 2
+    )
     cached_assets_storage_client = StorageClient(
         protocol=app_config.cached_assets.storage_protocol,
         storage_root=app_config.cached_assets.storage_root,
@@ -104,6 +109,11 @@ def create_app_with_config(app_config: AppConfig) -> Starlette:
                 extensions_directory=app_config.duckdb_index.extensions_directory,
                 clean_cache_proba=app_config.duckdb_index.clean_cache_proba,
                 expiredTimeIntervalSeconds=app_config.duckdb_index.expired_time_interval_seconds,
+                response_cache=ResponseCache(
+                    max_bytes=app_config.api.response_cache_max_bytes,
+                    ttl_seconds=app_config.api.response_cache_ttl_seconds,
+                    max_stale_seconds=response_cache_max_stale_seconds,
+                ),
             ),
         ),
         Route(
@@ -125,6 +135,11 @@ def create_app_with_config(app_config: AppConfig) -> Starlette:
                 extensions_directory=app_config.duckdb_index.extensions_directory,
                 clean_cache_proba=app_config.duckdb_index.clean_cache_proba,
                 expiredTimeIntervalSeconds=app_config.duckdb_index.expired_time_interval_seconds,
+                response_cache=ResponseCache(
+                    max_bytes=app_config.api.response_cache_max_bytes,
+                    ttl_seconds=app_config.api.response_cache_ttl_seconds,
+                    max_stale_seconds=response_cache_max_stale_seconds,
+                ),
             ),
         ),
     ]
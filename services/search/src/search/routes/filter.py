@@ -4,8 +4,10 @@
 import logging
 import random
 import re
+import threading
+from collections import OrderedDict
 from http import HTTPStatus
-from typing import Optional
+from typing import Any, Optional
 
 import anyio
 import duckdb
@@ -23,16 +25,18 @@ from libapi.request import (
     get_request_parameter_offset,
 )
 from libapi.response import create_response
+from libapi.response_cache import ResponseCache
 from libapi.utils import (
     Endpoint,
     get_json_api_error_response,
     get_json_error_response,
-    get_json_ok_response,
+    get_serialized_json_ok_response,
 )
 from libcommon.duckdb_utils import duckdb_index_is_partial
 from libcommon.prometheus import StepProfiler
 from libcommon.storage import StrPath, clean_dir
 from libcommon.storage_client import StorageClient
+from libcommon.utils import orjson_dumps
 from libcommon.viewer_utils.features import get_supported_unsupported_columns
 from starlette.requests import Request
 from starlette.responses import Response
@@ -52,6 +56,13 @@ FILTER_COUNT_QUERY = """\
     FROM data
     {where}"""
 
+# the number of rows matching a filter does not change for a given index file (its location depends on the dataset
+# revision): count them once, and reuse the count when paginating through the results
+NUM_ROWS_TOTAL_CACHE_MAX_SIZE = 1_000
+_num_rows_total_cache: OrderedDict[tuple[str, str], int] = OrderedDict()
+# the filter queries are executed in worker threads
+_num_rows_total_cache_lock = threading.Lock()
+
 SQL_INVALID_SYMBOLS = "|".join([";", "--", r"/\*", r"\*/"])
 SQL_INVALID_SYMBOLS_PATTERN = re.compile(rf"(?:{SQL_INVALID_SYMBOLS})", flags=re.IGNORECASE)
 
@@ -75,9 +86,12 @@ def create_filter_endpoint(
     extensions_directory: Optional[str] = None,
     clean_cache_proba: float = 0.0,
     expiredTimeIntervalSeconds: int = 60,
+    response_cache: Optional[ResponseCache] = None,
 ) -> Endpoint:
     async def filter_endpoint(request: Request) -> Response:
         revision: Optional[str] = None
+        response_cache_key: Optional[tuple[Any, ...]] = None
+        authenticated = False
         with StepProfiler(method="filter_endpoint", step="all"):
             try:
                 with StepProfiler(method="filter_endpoint", step="validate parameters"):
@@ -93,6 +107,7 @@ def create_filter_endpoint(
                     logger.info(
                         f"/filter, {dataset=}, {config=}, {split=}, {where=}, {orderby=}, {offset=}, {length=}"
                     )
+                    response_cache_key = (dataset, config, split, where, orderby, offset, length)
                 with StepProfiler(method="filter_endpoint", step="check authentication"):
                     # If auth_check fails, it will raise an exception that will be caught below
                     await auth_check(
@@ -103,6 +118,7 @@ def create_filter_endpoint(
                         hf_jwt_algorithm=hf_jwt_algorithm,
                         hf_timeout_seconds=hf_timeout_seconds,
                     )
+                    authenticated = True
                 with StepProfiler(method="filter_endpoint", step="validate indexing was done"):
                     # no cache data is needed to download the index file
                     # but will help to validate if indexing was done
@@ -132,6 +148,13 @@ def create_filter_endpoint(
                     index_size = duckdb_index_cache_entry["content"]["size"]
                     partial = duckdb_index_is_partial(url)
 
+                with StepProfiler(method="filter_endpoint", step="get the response from the cache"):
+                    cached_response = (
+                        response_cache.get(response_cache_key, revision=revision) if response_cache else None
+                    )
+                if cached_response is not None:
+                    return get_serialized_json_ok_response(cached_response, max_age=max_age_long, revision=revision)
+
                 with StepProfiler(method="filter_endpoint", step="download index file if missing"):
                     index_file_location = await get_index_file_location_and_download_if_missing(
                         duckdb_index_file_directory=duckdb_index_file_directory,
@@ -188,8 +211,24 @@ def create_filter_endpoint(
                         use_row_idx_column=True,
                     )
                 with StepProfiler(method="filter_endpoint", step="generate the OK response"):
-                    return get_json_ok_response(content=response, max_age=max_age_long, revision=revision)
+                    serialized_response = orjson_dumps(response)
+                    if response_cache:
+                        response_cache.set(response_cache_key, revision=revision, content=serialized_response)
+                    return get_serialized_json_ok_response(
+                        serialized_response, max_age=max_age_long, revision=revision
+                    )
             except Exception as e:
+                if not isinstance(e, ApiError) and authenticated and response_cache and response_cache_key:
+                    # serve the last known response, if any, rather than an error (e.g. if the database is down)
+                    stale_entry = response_cache.get_stale(response_cache_key)
+                    if stale_entry is not None:
+                        logging.warning(f"serving a stale response after an unexpected error: {e}")
+                        return get_serialized_json_ok_response(
+                            stale_entry.content,
+                            max_age=max_age_short,
+                            revision=stale_entry.revision,
+                            headers={"X-Cache": "stale"},
+                        )
                 error = e if isinstance(e, ApiError) else UnexpectedApiError("Unexpected error.", e)
                 with StepProfiler(method="filter_endpoint", step="generate API error response"):
                     return get_json_api_error_response(error=error, max_age=max_age_short, revision=revision)
@@ -214,15 +253,38 @@ def execute_filter_query(
             limit=limit,
             offset=offset,
         )
-        filter_count_query = FILTER_COUNT_QUERY.format(where=f"WHERE {where}" if where else "")
         try:
             pa_table = con.sql(filter_query).arrow()
-            num_rows_total = con.sql(filter_count_query).fetchall()[0][0]
+            num_rows_total = get_cached_num_rows_total(index_file_location=index_file_location, where=where)
+            if num_rows_total is None:
+                filter_count_query = FILTER_COUNT_QUERY.format(where=f"WHERE {where}" if where else "")
+                num_rows_total = con.sql(filter_count_query).fetchall()[0][0]
+                set_cached_num_rows_total(
+                    index_file_location=index_file_location, where=where, num_rows_total=num_rows_total
+                )
         except duckdb.Error as err:
             raise InvalidParameterError(message="A query parameter is invalid") from err
     return num_rows_total, pa_table
 
 
+def get_cached_num_rows_total(index_file_location: str, where: str) -> Optional[int]:
+    key = (index_file_location, where)
+    with _num_rows_total_cache_lock:
+        num_rows_total = _num_rows_total_cache.get(key)
+        if num_rows_total is not None:
+            _num_rows_total_cache.move_to_end(key)
+        return num_rows_total
+
+
+def set_cached_num_rows_total(index_file_location: str, where: str, num_rows_total: int) -> None:
+    key = (index_file_location, where)
+    with _num_rows_total_cache_lock:
+        _num_rows_total_cache[key] = num_rows_total
+        _num_rows_total_cache.move_to_end(key)
+        while len(_num_rows_total_cache) > NUM_ROWS_TOTAL_CACHE_MAX_SIZE:
+            _num_rows_total_cache.popitem(last=False)
+
+
 def validate_query_parameter(parameter_value: str, parameter_name: str) -> None:
     if SQL_INVALID_SYMBOLS_PATTERN.search(parameter_value):
         raise InvalidParameterError(message=f"Parameter '{parameter_name}' contains invalid symbols")
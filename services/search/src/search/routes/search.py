@@ -4,7 +4,7 @@
 import logging
 import random
 from http import HTTPStatus
-from typing import Optional
+from typing import Any, Optional
 
 import anyio
 import pyarrow as pa
@@ -24,11 +24,13 @@ from libapi.request import (
     get_request_parameter_length,
     get_request_parameter_offset,
 )
+from libapi.response import get_features_list
+from libapi.response_cache import ResponseCache
 from libapi.utils import (
     Endpoint,
     get_json_api_error_response,
     get_json_error_response,
-    get_json_ok_response,
+    get_serialized_json_ok_response,
     to_rows_list,
 )
 from libcommon.constants import HF_FTS_SCORE, MAX_NUM_ROWS_PER_PAGE, ROW_IDX_COLUMN
@@ -37,10 +39,8 @@ from libcommon.duckdb_utils import duckdb_index_is_partial
 from libcommon.prometheus import StepProfiler
 from libcommon.storage import StrPath, clean_dir
 from libcommon.storage_client import StorageClient
-from libcommon.viewer_utils.features import (
-    get_supported_unsupported_columns,
-    to_features_list,
-)
+from libcommon.utils import orjson_dumps
+from libcommon.viewer_utils.features import get_supported_unsupported_columns
 from starlette.requests import Request
 from starlette.responses import Response
 
@@ -89,13 +89,18 @@ async def create_response(
     num_rows_total: int,
     partial: bool,
 ) -> PaginatedResponse:
-    features_without_key = features.copy()
-    features_without_key.pop(ROW_IDX_COLUMN, None)
     pa_table = pa_table.drop(unsupported_columns)
     logging.info(f"create response for {dataset=} {config=} {split=}")
 
     return PaginatedResponse(
-        features=to_features_list(features_without_key),
+        # pass the same features as /filter, so that both endpoints share the same entry in the features list cache
+        features=[
+            feature_item
+            for feature_item in get_features_list(
+                dataset=dataset, revision=revision, config=config, split=split, features=features
+            )
+            if feature_item["name"] != ROW_IDX_COLUMN
+        ],
         rows=await to_rows_list(
             pa_table=pa_table,
             dataset=dataset,
@@ -105,7 +110,6 @@ async def create_response(
             storage_client=storage_client,
             offset=offset,
             features=features,
-            unsupported_columns=unsupported_columns,
             row_idx_column=ROW_IDX_COLUMN,
         ),
         num_rows_total=num_rows_total,
@@ -131,9 +135,12 @@ def create_search_endpoint(
     extensions_directory: Optional[str] = None,
     clean_cache_proba: float = 0.0,
     expiredTimeIntervalSeconds: int = 60,
+    response_cache: Optional[ResponseCache] = None,
 ) -> Endpoint:
     async def search_endpoint(request: Request) -> Response:
         revision: Optional[str] = None
+        response_cache_key: Optional[tuple[Any, ...]] = None
+        authenticated = False
         with StepProfiler(method="search_endpoint", step="all"):
             try:
                 with StepProfiler(method="search_endpoint", step="validate parameters"):
@@ -143,6 +150,7 @@ def create_search_endpoint(
                     query = get_request_parameter(request, "query", required=True)
                     offset = get_request_parameter_offset(request)
                     length = get_request_parameter_length(request)
+                    response_cache_key = (dataset, config, split, query, offset, length)
 
                 with StepProfiler(method="search_endpoint", step="check authentication"):
                     # if auth_check fails, it will raise an exception that will be caught below
@@ -154,6 +162,7 @@ def create_search_endpoint(
                         hf_jwt_algorithm=hf_jwt_algorithm,
                         hf_timeout_seconds=hf_timeout_seconds,
                     )
+                    authenticated = True
 
                 logging.info(f"/search {dataset=} {config=} {split=} {query=} {offset=} {length=}")
 
@@ -188,6 +197,13 @@ def create_search_endpoint(
                     index_size = duckdb_index_cache_entry["content"]["size"]
                     partial = duckdb_index_is_partial(url)
 
+                with StepProfiler(method="search_endpoint", step="get the response from the cache"):
+                    cached_response = (
+                        response_cache.get(response_cache_key, revision=revision) if response_cache else None
+                    )
+                if cached_response is not None:
+                    return get_serialized_json_ok_response(cached_response, max_age=max_age_long, revision=revision)
+
                 with StepProfiler(method="search_endpoint", step="download index file if missing"):
                     index_file_location = await get_index_file_location_and_download_if_missing(
                         duckdb_index_file_directory=duckdb_index_file_directory,
@@ -242,8 +258,24 @@ def create_search_endpoint(
                     )
                     logging.info(f"transform rows finished for {dataset=} {config=} {split=}")
                 with StepProfiler(method="search_endpoint", step="generate the OK response"):
-                    return get_json_ok_response(response, max_age=max_age_long, revision=revision)
+                    serialized_response = orjson_dumps(response)
+                    if response_cache:
+                        response_cache.set(response_cache_key, revision=revision, content=serialized_response)
+                    return get_serialized_json_ok_response(
+                        serialized_response, max_age=max_age_long, revision=revision
+                    )
             except Exception as e:
+                if not isinstance(e, ApiError) and authenticated and response_cache and response_cache_key:
+                    # serve the last known response, if any, rather than an error (e.g. if the database is down)
+                    stale_entry = response_cache.get_stale(response_cache_key)
+                    if stale_entry is not None:
+                        logging.warning(f"serving a stale response after an unexpected error: {e}")
+                        return get_serialized_json_ok_response(
+                            stale_entry.content,
+                            max_age=max_age_short,
+                            revision=stale_entry.revision,
+                            headers={"X-Cache": "stale"},
+                        )
                 error = e if isinstance(e, ApiError) else UnexpectedApiError("Unexpected error.", e)
                 with StepProfiler(method="search_endpoint", step="generate API error response"):
                     return get_json_api_error_response(error=error, max_age=max_age_short, revision=revision)
@@ -2,9 +2,10 @@
 # Copyright 2023 The HuggingFace Authors.
 
 import os
+import time
 from collections.abc import Generator
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 import duckdb
 import pyarrow as pa
@@ -13,11 +14,21 @@ import pytest
 from datasets import Dataset
 from libapi.exceptions import InvalidParameterError
 from libapi.response import create_response
+from libapi.response_cache import ResponseCache
 from libcommon.constants import ROW_IDX_COLUMN
+from libcommon.storage import StrPath
 from libcommon.storage_client import StorageClient
 
 from search.config import AppConfig
-from search.routes.filter import execute_filter_query, validate_query_parameter
+from search.routes.filter import (
+    create_filter_endpoint,
+    execute_filter_query,
+    get_cached_num_rows_total,
+    set_cached_num_rows_total,
+    validate_query_parameter,
+)
+
+from ..utils import CONFIG, DATASET, SPLIT, get_test_client, upsert_duckdb_index_cache_entry
 
 CACHED_ASSETS_FOLDER = "cached-assets"
 
@@ -65,6 +76,25 @@ def index_file_location(ds: Dataset) -> Generator[str, None, None]:
     os.remove(index_file_location)
 
 
+@pytest.fixture
+def executed_filter_queries(monkeypatch: pytest.MonkeyPatch, index_file_location: str) -> list[str]:
+    # serve the local index file, and record the filter queries that are actually executed
+    executed_filter_queries: list[str] = []
+
+    async def get_index_file_location(**kwargs: Any) -> str:
+        return index_file_location
+
+    def record_and_execute_filter_query(index_file_location: str, *args: Any) -> tuple[int, pa.Table]:
+        executed_filter_queries.append(index_file_location)
+        return execute_filter_query(index_file_location, *args)
+
+    monkeypatch.setattr(
+        "search.routes.filter.get_index_file_location_and_download_if_missing", get_index_file_location
+    )
+    monkeypatch.setattr("search.routes.filter.execute_filter_query", record_and_execute_filter_query)
+    return executed_filter_queries
+
+
 @pytest.mark.parametrize(
     "parameter_name, parameter_value", [("where", "\"col\"='A'"), ("orderby", '"A"'), ("orderby", '"A" DESC')]
 )
@@ -134,6 +164,14 @@ def test_execute_filter_query_raises(where: str, index_file_location: str) -> No
         )
 
 
+def test_cached_num_rows_total() -> None:
+    index_file_location, where = "not-indexed.duckdb", "\"gender\"='female'"
+    assert get_cached_num_rows_total(index_file_location=index_file_location, where=where) is None
+    set_cached_num_rows_total(index_file_location=index_file_location, where=where, num_rows_total=2)
+    assert get_cached_num_rows_total(index_file_location=index_file_location, where=where) == 2
+    assert get_cached_num_rows_total(index_file_location=index_file_location, where="") is None
+
+
 async def test_create_response(ds: Dataset, app_config: AppConfig, storage_client: StorageClient) -> None:
     dataset, config, split = "ds", "default", "train"
     pa_table = pa.Table.from_pydict(
@@ -174,3 +212,84 @@ async def test_create_response(ds: Dataset, app_config: AppConfig, storage_clien
         "num_rows_per_page": 100,
         "partial": False,
     }
+
+
+def test_filter_endpoint_response_cache(
+    ds: Dataset,
+    app_config: AppConfig,
+    storage_client: StorageClient,
+    duckdb_index_cache_directory: StrPath,
+    executed_filter_queries: list[str],
+) -> None:
+    client = get_test_client(
+        "/filter",
+        create_filter_endpoint(
+            duckdb_index_file_directory=duckdb_index_cache_directory,
+            target_revision=app_config.duckdb_index.target_revision,
+            cached_assets_storage_client=storage_client,
+            blocked_datasets=[],
+            hf_endpoint=app_config.common.hf_endpoint,
+            response_cache=ResponseCache(max_bytes=1_000_000, ttl_seconds=60),
+        ),
+    )
+    params = {"dataset": DATASET, "config": CONFIG, "split": SPLIT, "where": "\"gender\"='female'"}
+    upsert_duckdb_index_cache_entry(features=ds.features, revision="revision-1")
+    response = client.get("/filter", params=params)
+    assert response.status_code == 200
+    assert response.json()["num_rows_total"] == 2
+    assert len(executed_filter_queries) == 1
+    # the same request is served from the cache
+    cached_response = client.get("/filter", params=params)
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+    assert cached_response.headers["X-Revision"] == "revision-1"
+    assert len(executed_filter_queries) == 1
+    # a new revision of the dataset is a cache miss
+    upsert_duckdb_index_cache_entry(features=ds.features, revision="revision-2")
+    new_response = client.get("/filter", params=params)
+    assert new_response.status_code == 200
+    assert new_response.headers["X-Revision"] == "revision-2"
+    assert len(executed_filter_queries) == 2
+
+
+def test_filter_endpoint_stale_response(
+    monkeypatch: pytest.MonkeyPatch,
+    ds: Dataset,
+    app_config: AppConfig,
+    storage_client: StorageClient,
+    duckdb_index_cache_directory: StrPath,
+    executed_filter_queries: list[str],
+) -> None:
+    client = get_test_client(
+        "/filter",
+        create_filter_endpoint(
+            duckdb_index_file_directory=duckdb_index_cache_directory,
+            target_revision=app_config.duckdb_index.target_revision,
+            cached_assets_storage_client=storage_client,
+            blocked_datasets=[],
+            hf_endpoint=app_config.common.hf_endpoint,
+            response_cache=ResponseCache(max_bytes=1_000_000, ttl_seconds=0.1, max_stale_seconds=1),
+        ),
+    )
+    params = {"dataset": DATASET, "config": CONFIG, "split": SPLIT, "where": "\"gender\"='female'"}
+    upsert_duckdb_index_cache_entry(features=ds.features, revision="revision-1")
+    response = client.get("/filter", params=params)
+    assert response.status_code == 200
+    assert "X-Cache" not in response.headers
+
+    def fail_filter_query(*args: Any) -> tuple[int, pa.Table]:
+        raise RuntimeError("the backend is down")
+
+    monkeypatch.setattr("search.routes.filter.execute_filter_query", fail_filter_query)
+    # the expired response is served as a fallback
+    time.sleep(0.2)
+    stale_response = client.get("/filter", params=params)
+    assert stale_response.status_code == 200
+    assert stale_response.headers["X-Cache"] == "stale"
+    assert stale_response.content == response.content
+    # but not once it is older than max_stale_seconds: the error is returned
+    time.sleep(1)
+    error_response = client.get("/filter", params=params)
+    assert error_response.status_code == 500
+    assert error_response.headers["X-Error-Code"] == "UnexpectedApiError"
+    assert "X-Cache" not in error_response.headers
@@ -2,17 +2,78 @@
 # Copyright 2023 The HuggingFace Authors.
 
 import os
+from collections.abc import Generator
+from pathlib import Path
 from typing import Any
 
 import duckdb
 import pandas as pd
 import pyarrow as pa
 import pytest
+from datasets import Features, Value
 from libapi.duckdb import get_download_folder
+from libapi.response import create_response as create_filter_response
+from libapi.response_cache import ResponseCache
 from libcommon.constants import ROW_IDX_COLUMN
 from libcommon.storage import StrPath
+from libcommon.storage_client import StorageClient
+from libcommon.viewer_utils.features import to_features_list
 
-from search.routes.search import full_text_search
+from search.config import AppConfig
+from search.routes.search import create_response, create_search_endpoint, full_text_search
+
+from ..utils import CONFIG, DATASET, SPLIT, get_test_client, upsert_duckdb_index_cache_entry
+
+TEXTS = [
+    "Grand Moff Tarkin and Lord Vader are interrupted in their discussion by the buzz of the comlink",
+    "There goes another one.",
+    "Vader turns round and round in circles as his ship spins into space.",
+    "We count thirty Rebel ships.",
+    "The wingman spots the pirateship coming at him and warns the Dark Lord",
+]
+
+
+@pytest.fixture
+def storage_client(tmp_path: Path, app_config: AppConfig) -> StorageClient:
+    return StorageClient(
+        protocol="file",
+        storage_root=str(tmp_path / "cached-assets"),
+        base_url=app_config.cached_assets.base_url,
+    )
+
+
+@pytest.fixture
+def fts_index_file_location(tmp_path: Path) -> Generator[str, None, None]:
+    index_file_location = str(tmp_path / "index.duckdb")
+    con = duckdb.connect(index_file_location)
+    con.execute("INSTALL 'fts';")
+    con.execute("LOAD 'fts';")
+    con.sql("CREATE OR REPLACE SEQUENCE serial START 0 MINVALUE 0;")
+    sample_df = pd.DataFrame({"text": TEXTS}, dtype=pd.StringDtype(storage="python"))  # noqa: F841
+    con.sql(f"CREATE OR REPLACE TABLE data AS SELECT nextval('serial') AS {ROW_IDX_COLUMN}, * FROM sample_df")
+    con.sql(f"PRAGMA create_fts_index('data', '{ROW_IDX_COLUMN}', '*', overwrite=1);")
+    con.close()
+    yield index_file_location
+    os.remove(index_file_location)
+
+
+@pytest.fixture
+def executed_searches(monkeypatch: pytest.MonkeyPatch, fts_index_file_location: str) -> list[str]:
+    # serve the local index file, and record the searches that are actually executed
+    executed_searches: list[str] = []
+
+    async def get_index_file_location(**kwargs: Any) -> str:
+        return fts_index_file_location
+
+    def record_and_full_text_search(index_file_location: str, *args: Any) -> tuple[int, pa.Table]:
+        executed_searches.append(index_file_location)
+        return full_text_search(index_file_location, *args)
+
+    monkeypatch.setattr(
+        "search.routes.search.get_index_file_location_and_download_if_missing", get_index_file_location
+    )
+    monkeypatch.setattr("search.routes.search.full_text_search", record_and_full_text_search)
+    return executed_searches
 
 
 def test_get_download_folder(duckdb_index_cache_directory: StrPath) -> None:
@@ -107,3 +168,77 @@ def test_full_text_search(
     con.close()
 
     os.remove(index_file_location)
+
+
+def test_search_endpoint_response_cache(
+    app_config: AppConfig,
+    storage_client: StorageClient,
+    duckdb_index_cache_directory: StrPath,
+    executed_searches: list[str],
+) -> None:
+    client = get_test_client(
+        "/search",
+        create_search_endpoint(
+            duckdb_index_file_directory=duckdb_index_cache_directory,
+            cached_assets_storage_client=storage_client,
+            target_revision=app_config.duckdb_index.target_revision,
+            hf_endpoint=app_config.common.hf_endpoint,
+            blocked_datasets=[],
+            response_cache=ResponseCache(max_bytes=1_000_000, ttl_seconds=60),
+        ),
+    )
+    features = Features({"text": Value("string")})
+    params = {"dataset": DATASET, "config": CONFIG, "split": SPLIT, "query": "Lord Vader"}
+    upsert_duckdb_index_cache_entry(features=features, revision="revision-1", stemmer="porter")
+    response = client.get("/search", params=params)
+    assert response.status_code == 200
+    assert response.json()["num_rows_total"] == 3
+    assert len(executed_searches) == 1
+    # the same request is served from the cache
+    cached_response = client.get("/search", params=params)
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+    assert cached_response.headers["X-Revision"] == "revision-1"
+    assert len(executed_searches) == 1
+    # a new revision of the dataset is a cache miss
+    upsert_duckdb_index_cache_entry(features=features, revision="revision-2", stemmer="porter")
+    new_response = client.get("/search", params=params)
+    assert new_response.status_code == 200
+    assert new_response.headers["X-Revision"] == "revision-2"
+    assert len(executed_searches) == 2
+
+
+@pytest.mark.anyio
+async def test_create_response_shares_the_features_list_with_filter(
+    monkeypatch: pytest.MonkeyPatch, storage_client: StorageClient
+) -> None:
+    converted_features: list[Features] = []
+
+    def record_and_to_features_list(features: Features) -> Any:
+        converted_features.append(features)
+        return to_features_list(features)
+
+    monkeypatch.setattr("libapi.response.to_features_list", record_and_to_features_list)
+    # the features of the duckdb index, as used by /search and /filter
+    features = Features({"text": Value("string"), ROW_IDX_COLUMN: Value("int64")})
+    kwargs: dict[str, Any] = {
+        "dataset": DATASET,
+        "revision": "revision",
+        "config": CONFIG,
+        "split": "shared-features-list",
+        "storage_client": storage_client,
+        "pa_table": pa.Table.from_pydict({ROW_IDX_COLUMN: [0], "text": [TEXTS[0]]}),
+        "offset": 0,
+        "features": features,
+        "unsupported_columns": [],
+        "num_rows_total": 1,
+        "partial": False,
+    }
+    filter_response = await create_filter_response(**kwargs, use_row_idx_column=True)
+    search_response = await create_response(**kwargs)
+    assert search_response["features"] == filter_response["features"]
+    assert search_response["features"] == [
+        {"feature_idx": 0, "name": "text", "type": {"dtype": "string", "_type": "Value"}}
+    ]
+    # the features list is computed once, and shared by both endpoints
+    assert len(converted_features) == 1
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright 2024 The HuggingFace Authors.
+
+from http import HTTPStatus
+from typing import Optional
+
+from datasets import Features, Value
+from libapi.utils import Endpoint
+from libcommon.constants import ROW_IDX_COLUMN, SPLIT_DUCKDB_INDEX_KIND
+from libcommon.simple_cache import upsert_response
+from starlette.applications import Starlette
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+DATASET = "dataset"
+CONFIG = "config"
+SPLIT = "split"
+INDEX_FILENAME = "index.duckdb"
+
+
+def upsert_duckdb_index_cache_entry(features: Features, revision: str, stemmer: Optional[str] = None) -> None:
+    upsert_response(
+        kind=SPLIT_DUCKDB_INDEX_KIND,
+        dataset=DATASET,
+        config=CONFIG,
+        split=SPLIT,
+        dataset_git_revision=revision,
+        content={
+            "url": f"https://hub/datasets/{DATASET}/resolve/refs%2Fconvert%2Fduckdb/{CONFIG}/{SPLIT}/{INDEX_FILENAME}",
+            "filename": INDEX_FILENAME,
+            "size": 1,
+            # split-duckdb-index always adds the ROW_IDX_COLUMN column, after the dataset columns
+            "features": Features({**features, ROW_IDX_COLUMN: Value("int64")}).to_dict(),
+            "stemmer": stemmer,
+        },
+        http_status=HTTPStatus.OK,
+    )
+
+
+def get_test_client(path: str, endpoint: Endpoint) -> TestClient:
+    return TestClient(Starlette(routes=[Route(path, endpoint=endpoint)]))
@@ -70,8 +70,15 @@ def get_rows(
         raise TypeError("load_dataset should return a Dataset in normal mode")
     if column_names:
         ds = ds.select_columns(column_names)
-    rows_plus_one = list(itertools.islice(ds, rows_max_number + 1))
-    # ^^ to be able to detect if a split has exactly ROWS_MAX_NUMBER rows
+    if isinstance(ds, Dataset):
+        # read the rows in one batch, rather than formatting them one by one
+        num_rows_plus_one = min(ds.num_rows, rows_max_number + 1)
+        # ^^ to be able to detect if a split has exactly ROWS_MAX_NUMBER rows
+        columns = ds[:num_rows_plus_one]
+        rows_plus_one = [{name: values[idx] for name, values in columns.items()} for idx in range(num_rows_plus_one)]
+    else:
+        rows_plus_one = list(itertools.islice(ds, rows_max_number + 1))
+        # ^^ to be able to detect if a split has exactly ROWS_MAX_NUMBER rows
     rows = rows_plus_one[:rows_max_number]
     all_fetched = len(rows_plus_one) <= rows_max_number
     if all_fetched:
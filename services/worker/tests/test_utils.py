@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright 2024 The HuggingFace Authors.
 
+from typing import Any, Optional
 
 import pytest
+from datasets import Dataset
 
-from worker.utils import FileExtension, get_file_extension
+from worker.utils import FileExtension, get_file_extension, get_rows
 
 
 @pytest.mark.parametrize(
@@ -45,3 +47,35 @@ from worker.utils import FileExtension, get_file_extension
 def test_get_file_extension(filename: str, expected_extension: FileExtension) -> None:
     assert get_file_extension(filename).extension == expected_extension.extension
     assert get_file_extension(filename).uncompressed_extension == expected_extension.uncompressed_extension
+
+
+@pytest.mark.parametrize(
+    "rows_max_number,column_names,expected_rows,expected_all_fetched",
+    [
+        (2, None, [{"text": "a", "label": 0}, {"text": "b", "label": 1}], False),
+        (3, None, [{"text": "a", "label": 0}, {"text": "b", "label": 1}, {"text": "c", "label": 0}], True),
+        (4, None, [{"text": "a", "label": 0}, {"text": "b", "label": 1}, {"text": "c", "label": 0}], True),
+        (2, ["label"], [{"label": 0}, {"label": 1}], False),
+        (3, ["label"], [{"label": 0}, {"label": 1}, {"label": 0}], True),
+    ],
+)
+def test_get_rows(
+    monkeypatch: pytest.MonkeyPatch,
+    rows_max_number: int,
+    column_names: Optional[list[str]],
+    expected_rows: list[dict[str, Any]],
+    expected_all_fetched: bool,
+) -> None:
+    ds = Dataset.from_dict({"text": ["a", "b", "c"], "label": [0, 1, 0]})
+    monkeypatch.setattr("worker.utils.load_dataset", lambda *args, **kwargs: ds)
+    rows_content = get_rows(
+        dataset="dataset",
+        config="config",
+        split="split",
+        streaming=False,
+        rows_max_number=rows_max_number,
+        column_names=column_names,
+    )
+    assert rows_content.rows == expected_rows
+    assert rows_content.all_fetched == expected_all_fetched
+    assert rows_content.truncated_columns == []